@@ -0,0 +1,301 @@
+# audio_jobs.py — Offline audio-file translation, faster than real time
+import asyncio
+import io
+import os
+import tempfile
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+SAMPLE_RATE = 16000
+
+# Speech segmentation (Silero VAD)
+VAD_CONFIDENCE = 0.5
+MIN_SILENCE_SECS = 0.5     # silence that ends a segment
+MIN_SPEECH_SECS = 0.25     # shorter blips are dropped
+SEGMENT_PAD_SECS = 0.2     # context kept around each segment
+MAX_SEGMENT_SECS = 28.0    # stay inside Whisper's 30s window
+
+
+@dataclass
+class Segment:
+    index: int
+    start: float
+    end: float
+    source_text: str = ""
+    translation: str = ""
+    output_start: Optional[float] = None
+    output_end: Optional[float] = None
+
+
+@dataclass
+class AudioJob:
+    id: str
+    filename: str
+    status: str = "queued"  # queued → segmenting → processing → done | failed
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    audio_secs: float = 0.0
+    wall_secs: float = 0.0
+    realtime_factor: float = 0.0
+    segments: List[Segment] = field(default_factory=list)
+    transcribed: int = 0
+    translated: int = 0
+    synthesized: int = 0
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def progress(self) -> float:
+        if self.status == "done":
+            return 1.0
+        if not self.segments:
+            return 0.0
+        done = self.transcribed + self.translated + self.synthesized
+        return done / (3 * len(self.segments))
+
+    def summary(self, include_segments: bool = False) -> Dict[str, object]:
+        result = {
+            "job_id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "progress": round(self.progress, 3),
+            "segments_total": len(self.segments),
+            "transcribed": self.transcribed,
+            "translated": self.translated,
+            "synthesized": self.synthesized,
+            "audio_secs": round(self.audio_secs, 2),
+            "wall_secs": round(self.wall_secs, 2),
+            "realtime_factor": round(self.realtime_factor, 2),
+            "error": self.error,
+        }
+        if include_segments:
+            result["segments"] = [asdict(s) for s in self.segments]
+        return result
+
+
+def decode_audio(data: bytes, filename: str) -> np.ndarray:
+    """Decode an upload to 16 kHz mono float32"""
+    if filename.lower().endswith(".wav"):
+        from scipy.io import wavfile
+        from scipy.signal import resample_poly
+
+        rate, audio = wavfile.read(io.BytesIO(data))
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        if np.issubdtype(audio.dtype, np.integer):
+            audio = audio.astype(np.float32) / np.iinfo(audio.dtype).max
+        audio = audio.astype(np.float32)
+        if rate != SAMPLE_RATE:
+            gcd = np.gcd(rate, SAMPLE_RATE)
+            audio = resample_poly(audio, SAMPLE_RATE // gcd, rate // gcd).astype(np.float32)
+        return audio
+
+    # Anything else goes through ffmpeg, via the Whisper loader
+    from mlx_whisper.audio import load_audio
+
+    suffix = os.path.splitext(filename)[1] or ".bin"
+    with tempfile.NamedTemporaryFile(suffix=suffix) as tmp:
+        tmp.write(data)
+        tmp.flush()
+        return load_audio(tmp.name, sr=SAMPLE_RATE)
+
+
+def split_speech(audio: np.ndarray) -> List[Segment]:
+    """Find speech regions with the same Silero VAD the live pipeline uses"""
+    from pipecat.audio.vad.silero import SileroVADAnalyzer
+
+    vad = SileroVADAnalyzer(sample_rate=SAMPLE_RATE)
+    vad.set_sample_rate(SAMPLE_RATE)
+    chunk = vad.num_frames_required()
+    chunk_secs = chunk / SAMPLE_RATE
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+
+    regions = []
+    speech_start = None
+    silence = 0.0
+    for offset in range(0, len(pcm) - chunk + 1, chunk):
+        t = offset / SAMPLE_RATE
+        is_speech = vad.voice_confidence(pcm[offset:offset + chunk].tobytes()) >= VAD_CONFIDENCE
+        if is_speech:
+            if speech_start is None:
+                speech_start = t
+            silence = 0.0
+        elif speech_start is not None:
+            silence += chunk_secs
+            if silence >= MIN_SILENCE_SECS:
+                regions.append((speech_start, t - silence + chunk_secs))
+                speech_start = None
+                silence = 0.0
+        if speech_start is not None and t + chunk_secs - speech_start >= MAX_SEGMENT_SECS:
+            regions.append((speech_start, t + chunk_secs))
+            speech_start = None
+    if speech_start is not None:
+        regions.append((speech_start, len(pcm) / SAMPLE_RATE))
+
+    duration = len(audio) / SAMPLE_RATE
+    segments = []
+    for start, end in regions:
+        if end - start < MIN_SPEECH_SECS:
+            continue
+        segments.append(Segment(
+            index=len(segments),
+            start=max(0.0, start - SEGMENT_PAD_SECS),
+            end=min(duration, end + SEGMENT_PAD_SECS),
+        ))
+    return segments
+
+
+class AudioJobManager:
+    """
+    Runs offline translation jobs: VAD segmentation, then STT → translation →
+    TTS. Segments are transcribed in batches by a single STT worker shared by
+    all jobs (MLX is not thread-safe); each transcribed segment moves on to
+    translation and TTS with their own concurrency limits, so stages overlap
+    (batch 2 transcribes while segments of batch 1 are being synthesized).
+
+    Finished jobs and their output files are evicted after `retention_secs`.
+    """
+
+    def __init__(
+        self,
+        transcribe_batch: Callable[[List[np.ndarray]], List[str]],
+        translate: Callable[[str], Awaitable[str]],
+        synthesize: Callable[[str], Awaitable[np.ndarray]],
+        output_dir: Optional[str] = None,
+        stt_batch_size: int = 4,
+        llm_workers: int = 8,
+        tts_workers: int = 2,
+        retention_secs: float = 3600.0,
+    ):
+        self._transcribe_batch = transcribe_batch
+        self._translate = translate
+        self._synthesize = synthesize
+        self._output_dir = output_dir or os.path.join(tempfile.gettempdir(), "translation_jobs")
+        os.makedirs(self._output_dir, exist_ok=True)
+        self._stt_batch_size = max(1, stt_batch_size)
+        self._llm_workers = llm_workers
+        self._tts_workers = tts_workers
+        self._retention_secs = retention_secs
+        self._jobs: Dict[str, AudioJob] = {}
+        self._tasks: set = set()
+        self._stt_lock = asyncio.Lock()
+
+    def get(self, job_id: str) -> Optional[AudioJob]:
+        self._evict_expired()
+        return self._jobs.get(job_id)
+
+    def _evict_expired(self):
+        cutoff = time.time() - self._retention_secs
+        for job in [j for j in self._jobs.values() if j.finished_at and j.finished_at < cutoff]:
+            del self._jobs[job.id]
+            if job.output_path and os.path.exists(job.output_path):
+                os.remove(job.output_path)
+            logger.info(f"🧹 Evicted audio job {job.id}")
+
+    def submit(self, data: bytes, filename: str) -> AudioJob:
+        self._evict_expired()
+        job = AudioJob(id=uuid.uuid4().hex, filename=filename)
+        self._jobs[job.id] = job
+        task = asyncio.create_task(self._run(job, data))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, job: AudioJob, data: bytes):
+        start = time.perf_counter()
+        try:
+            job.status = "segmenting"
+            audio = await asyncio.to_thread(decode_audio, data, job.filename)
+            job.audio_secs = len(audio) / SAMPLE_RATE
+            job.segments = await asyncio.to_thread(split_speech, audio)
+            logger.info(f"🎞️ Job {job.id}: {job.audio_secs:.1f}s audio, {len(job.segments)} speech segments")
+
+            job.status = "processing"
+            llm_sem = asyncio.Semaphore(self._llm_workers)
+            tts_sem = asyncio.Semaphore(self._tts_workers)
+            outputs: Dict[int, np.ndarray] = {}
+
+            async def translate_and_speak(segment: Segment):
+                if not segment.source_text:
+                    job.translated += 1
+                    job.synthesized += 1
+                    return
+
+                async with llm_sem:
+                    segment.translation = await self._translate(segment.source_text)
+                job.translated += 1
+
+                if segment.translation:
+                    async with tts_sem:
+                        outputs[segment.index] = await self._synthesize(segment.translation)
+                job.synthesized += 1
+
+            followups = []
+            try:
+                for offset in range(0, len(job.segments), self._stt_batch_size):
+                    batch = job.segments[offset:offset + self._stt_batch_size]
+                    clips = [audio[int(s.start * SAMPLE_RATE):int(s.end * SAMPLE_RATE)] for s in batch]
+                    # One STT worker for every job - batches from concurrent jobs take turns
+                    async with self._stt_lock:
+                        texts = await asyncio.to_thread(self._transcribe_batch, clips)
+                    for segment, text in zip(batch, texts):
+                        segment.source_text = text
+                        job.transcribed += 1
+                        followups.append(asyncio.create_task(translate_and_speak(segment)))
+                await asyncio.gather(*followups)
+            finally:
+                for task in followups:
+                    task.cancel()
+
+            job.output_path = os.path.join(self._output_dir, f"{job.id}.wav")
+            await asyncio.to_thread(self._write_output, job, outputs)
+
+            job.status = "done"
+        except asyncio.CancelledError:
+            job.status = "failed"
+            job.error = "cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"Audio job {job.id} failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            job.wall_secs = time.perf_counter() - start
+            if job.wall_secs > 0:
+                job.realtime_factor = job.audio_secs / job.wall_secs
+            logger.info(
+                f"🎞️ Job {job.id} {job.status} in {job.wall_secs:.1f}s "
+                f"({job.realtime_factor:.1f}x real time)"
+            )
+
+    def _write_output(self, job: AudioJob, outputs: Dict[int, np.ndarray]):
+        """Lay translated audio on the source timeline, pushing later segments back if needed"""
+        from scipy.io import wavfile
+
+        cursor = 0.0
+        placed = []
+        for segment in job.segments:
+            clip = outputs.get(segment.index)
+            if clip is None:
+                continue
+            segment.output_start = max(segment.start, cursor)
+            segment.output_end = segment.output_start + len(clip) / SAMPLE_RATE
+            cursor = segment.output_end
+            placed.append((int(segment.output_start * SAMPLE_RATE), clip))
+
+        total = max([job.audio_secs * SAMPLE_RATE] + [offset + len(clip) for offset, clip in placed])
+        timeline = np.zeros(int(total), dtype=np.float32)
+        for offset, clip in placed:
+            timeline[offset:offset + len(clip)] = clip
+        wavfile.write(job.output_path, SAMPLE_RATE, (np.clip(timeline, -1.0, 1.0) * 32767).astype(np.int16))
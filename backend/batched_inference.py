@@ -0,0 +1,254 @@
+# batched_inference.py — Cross-session batched Silero VAD and Smart Turn v3 inference
+#
+# Every session still owns its analyzer state (Silero RNN state and context, Smart
+# Turn feature extraction), but the ONNX forward passes of all sessions in the
+# process are gathered by one shared batcher per model and run together.
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+from pipecat.audio.turn.smart_turn.base_smart_turn import BaseSmartTurn
+from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+from pipecat.audio.vad.silero import SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer
+
+# Latency budget: how long a request may wait for others to join its batch
+VAD_BATCH_MAX_WAIT_MS = float(os.getenv("VAD_BATCH_MAX_WAIT_MS", "2"))
+VAD_BATCH_MAX_SIZE = int(os.getenv("VAD_BATCH_MAX_SIZE", "64"))
+TURN_BATCH_MAX_WAIT_MS = float(os.getenv("TURN_BATCH_MAX_WAIT_MS", "5"))
+TURN_BATCH_MAX_SIZE = int(os.getenv("TURN_BATCH_MAX_SIZE", "16"))
+
+
+class MicroBatcher:
+    """
+    Gathers requests from many threads into batches for one worker thread.
+
+    Analyzers are called from the transports' executor threads, so callers
+    simply block on a future until their batch has run.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch: int,
+        max_wait_ms: float,
+    ):
+        self.name = name
+        self._batch_fn = batch_fn
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._queue: "queue.Queue[Tuple[Any, Future]]" = queue.Queue()
+
+        # 📊 Stats
+        self.batches = 0
+        self.items = 0
+        self.busy_secs = 0.0
+
+        self._worker = threading.Thread(target=self._run, name=f"{name}-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, item: Any) -> Any:
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future.result()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.perf_counter() + self._max_wait
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            items = [item for item, _ in batch]
+            start = time.perf_counter()
+            try:
+                results = self._batch_fn(items)
+            except Exception as e:
+                logger.error(f"{self.name} batch of {len(items)} failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            finally:
+                self.busy_secs += time.perf_counter() - start
+
+            self.batches += 1
+            self.items += len(items)
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "busy_secs": round(self.busy_secs, 3),
+        }
+
+
+# ---------------------------------------------------------------- Silero VAD
+
+
+class _SharedSileroModel:
+    """One ONNX session for every session's VAD; runs stacked chunks in one call"""
+
+    def __init__(self, session):
+        self._session = session
+        self.batcher = MicroBatcher("silero-vad", self._run_batch, VAD_BATCH_MAX_SIZE, VAD_BATCH_MAX_WAIT_MS)
+
+    def _run_batch(self, items: List[Tuple[np.ndarray, np.ndarray, int]]) -> List[Tuple[np.ndarray, np.ndarray]]:
+        results: List[Optional[Tuple[np.ndarray, np.ndarray]]] = [None] * len(items)
+        # Sessions normally share a sample rate, but don't mix them in one pass
+        for sr in {sr for _, _, sr in items}:
+            indexes = [i for i, (_, _, item_sr) in enumerate(items) if item_sr == sr]
+            x = np.concatenate([items[i][0] for i in indexes], axis=0)
+            state = np.concatenate([items[i][1] for i in indexes], axis=1)
+            out, new_state = self._session.run(
+                None, {"input": x, "state": state, "sr": np.array(sr, dtype="int64")}
+            )
+            for row, i in enumerate(indexes):
+                results[i] = (out[row:row + 1], new_state[:, row:row + 1])
+        return results
+
+
+class _BatchedSileroSession:
+    """
+    Drop-in for a session's SileroOnnxModel: keeps that session's RNN state and
+    audio context, and sends the forward pass to the shared batcher.
+    """
+
+    def __init__(self, shared: _SharedSileroModel):
+        self._shared = shared
+        self.reset_states()
+
+    def reset_states(self, batch_size: int = 1):
+        self._state = np.zeros((2, 1, 128), dtype="float32")
+        self._context = None
+        self._last_sr = 0
+
+    def __call__(self, x: np.ndarray, sr: int):
+        x = np.asarray(x, dtype="float32").reshape(1, -1)
+        context_size = 64 if sr == 16000 else 32
+        if self._last_sr and self._last_sr != sr:
+            self.reset_states()
+        if self._context is None:
+            self._context = np.zeros((1, context_size), dtype="float32")
+
+        x = np.concatenate((self._context, x), axis=1)
+        out, self._state = self._shared.batcher.submit((x, self._state, sr))
+        self._context = x[..., -context_size:]
+        self._last_sr = sr
+        return out
+
+
+_silero_lock = threading.Lock()
+_shared_silero: Optional[_SharedSileroModel] = None
+
+
+class BatchedSileroVADAnalyzer(SileroVADAnalyzer):
+    """
+    SileroVADAnalyzer whose inference is batched with every other session's.
+    Only the first instance in the process loads the ONNX model.
+    """
+
+    def __init__(self, **kwargs):
+        global _shared_silero
+        with _silero_lock:
+            if _shared_silero is None:
+                super().__init__(**kwargs)
+                _shared_silero = _SharedSileroModel(self._model.session)
+            else:
+                # Skip SileroVADAnalyzer's own model load - only its state is per session
+                VADAnalyzer.__init__(self, **kwargs)
+                self._last_reset_time = 0
+        self._model = _BatchedSileroSession(_shared_silero)
+
+
+# ---------------------------------------------------------------- Smart Turn v3
+
+
+class _SharedSmartTurnModel:
+    """One ONNX session for every session's end-of-turn prediction"""
+
+    def __init__(self, session, feature_extractor):
+        self._session = session
+        self.feature_extractor = feature_extractor  # stateless - safe to share
+        self._batched = True
+        self.batcher = MicroBatcher("smart-turn", self._run_batch, TURN_BATCH_MAX_SIZE, TURN_BATCH_MAX_WAIT_MS)
+
+    def _run_batch(self, features: List[np.ndarray]) -> List[float]:
+        if self._batched:
+            try:
+                outputs = self._session.run(None, {"input_features": np.concatenate(features, axis=0)})
+                return [float(p) for p in np.asarray(outputs[0]).reshape(-1)]
+            except Exception as e:
+                # Exported with a fixed batch dimension - fall back to one at a time
+                logger.warning(f"Smart Turn model rejected a batch, running sequentially: {e}")
+                self._batched = False
+        return [
+            float(np.asarray(self._session.run(None, {"input_features": f})[0]).reshape(-1)[0])
+            for f in features
+        ]
+
+
+_turn_lock = threading.Lock()
+_shared_turn: Optional[_SharedSmartTurnModel] = None
+
+
+class BatchedSmartTurnAnalyzerV3(LocalSmartTurnAnalyzerV3):
+    """
+    LocalSmartTurnAnalyzerV3 whose ONNX inference is batched across sessions.
+    Only the first instance in the process loads the model and feature extractor.
+    """
+
+    def __init__(self, *, smart_turn_model_path: Optional[str] = None, cpu_count: int = 1, **kwargs):
+        global _shared_turn
+        with _turn_lock:
+            if _shared_turn is None:
+                super().__init__(smart_turn_model_path=smart_turn_model_path, cpu_count=cpu_count, **kwargs)
+                _shared_turn = _SharedSmartTurnModel(self._session, self._feature_extractor)
+            else:
+                # Skip LocalSmartTurnAnalyzerV3's own model load - only turn state is per session
+                BaseSmartTurn.__init__(self, **kwargs)
+        self._shared_turn = _shared_turn
+        self._feature_extractor = _shared_turn.feature_extractor
+        # Inference goes through the shared model only
+        self._session = None
+
+    def _predict_endpoint(self, audio_array: np.ndarray) -> Dict[str, Any]:
+        # Same preprocessing as LocalSmartTurnAnalyzerV3 - last 8 seconds, Whisper features
+        max_samples = 8 * 16000
+        if len(audio_array) > max_samples:
+            audio_array = audio_array[-max_samples:]
+        inputs = self._feature_extractor(
+            audio_array,
+            sampling_rate=16000,
+            return_tensors="np",
+            padding="max_length",
+            max_length=max_samples,
+            truncation=True,
+            do_normalize=True,
+        )
+        input_features = np.expand_dims(inputs.input_features.squeeze(0).astype(np.float32), axis=0)
+
+        probability = self._shared_turn.batcher.submit(input_features)
+        prediction = 1 if probability > 0.5 else 0
+        return {"prediction": prediction, "probability": probability}
+
+
+def batching_stats() -> Dict[str, Any]:
+    return {
+        "vad": _shared_silero.batcher.stats() if _shared_silero else None,
+        "smart_turn": _shared_turn.batcher.stats() if _shared_turn else None,
+    }
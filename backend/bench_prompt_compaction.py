@@ -0,0 +1,106 @@
+# bench_prompt_compaction.py — Compare the full translation prompt with the script-aware one
+#
+#   python bench_prompt_compaction.py                 # latency + quality against LM Studio
+#   python bench_prompt_compaction.py --dry-run       # prompt sizes only, no LLM calls
+import argparse
+import asyncio
+import difflib
+import statistics
+import time
+
+import aiohttp
+
+from prompt_builder import (
+    MAX_TOKENS,
+    TRANSLATOR_SYSTEM_PROMPT,
+    build_system_prompt,
+    detect_script,
+    estimate_max_tokens,
+)
+
+SAMPLES = [
+    "Hello?",
+    "Where is the train station?",
+    "I would like to book a table for two at eight o'clock tonight.",
+    "Thank you so much for your help today, I really appreciate it.",
+    "¿Dónde está el baño?",
+    "Ich habe meinen Pass verloren.",
+    "Где здесь аптека?",
+    "Мне нужно позвонить врачу как можно скорее.",
+    "Ин як ҷумлаи тоҷикӣ аст.",
+    "今天天气很好。",
+    "我想买一张去杜尚别的票。",
+    "مرحبا، كيف حالك؟",
+]
+
+
+def _approx_tokens(text: str) -> int:
+    # ~4 UTF-8 bytes per token - only used to compare prompt sizes
+    return len(text.encode("utf-8")) // 4
+
+
+async def _translate(session, base_url, model, system_prompt, text, max_tokens):
+    start = time.perf_counter()
+    async with session.post(
+        f"{base_url}/chat/completions",
+        json={
+            "model": model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.05,
+            "top_p": 0.85
+        },
+        timeout=aiohttp.ClientTimeout(total=60)
+    ) as response:
+        result = await response.json()
+    elapsed = time.perf_counter() - start
+    choice = result["choices"][0]
+    return choice["message"]["content"].strip(), elapsed, choice.get("finish_reason")
+
+
+async def run(args):
+    print(f"{'script':<9} {'full tok':>8} {'compact tok':>11} {'max_tokens':>10}  text")
+    for text in SAMPLES:
+        print(
+            f"{detect_script(text):<9} {_approx_tokens(TRANSLATOR_SYSTEM_PROMPT):>8} "
+            f"{_approx_tokens(build_system_prompt(text)):>11} {estimate_max_tokens(text):>10}  {text}"
+        )
+    if args.dry_run:
+        return
+
+    full_latency, compact_latency, similarity = [], [], []
+    cut_off = 0  # compact runs that hit the scaled max_tokens (retried in production)
+    async with aiohttp.ClientSession() as session:
+        for text in SAMPLES:
+            for _ in range(args.repeat):
+                full, full_secs, _ = await _translate(
+                    session, args.base_url, args.model, TRANSLATOR_SYSTEM_PROMPT, text, MAX_TOKENS
+                )
+                compact, compact_secs, finish_reason = await _translate(
+                    session, args.base_url, args.model, build_system_prompt(text), text,
+                    estimate_max_tokens(text)
+                )
+                cut_off += finish_reason == "length"
+                full_latency.append(full_secs)
+                compact_latency.append(compact_secs)
+                similarity.append(difflib.SequenceMatcher(None, full, compact).ratio())
+            print(f"\n{text}\n  full    ({full_secs:.2f}s): {full}\n  compact ({compact_secs:.2f}s): {compact}")
+
+    print("\n📊 Summary")
+    print(f"  full prompt    median {statistics.median(full_latency):.3f}s")
+    print(f"  compact prompt median {statistics.median(compact_latency):.3f}s")
+    print(f"  output similarity (compact vs full) mean {statistics.mean(similarity):.3f}, "
+          f"identical {sum(s == 1.0 for s in similarity)}/{len(similarity)}")
+    print(f"  cut off by the scaled max_tokens {cut_off}/{len(compact_latency)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Full vs script-aware translation prompt")
+    parser.add_argument("--base-url", default="http://10.85.58.171:1234/v1")
+    parser.add_argument("--model", default="ameena_qwen3-8b")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per sample (default: 3)")
+    parser.add_argument("--dry-run", action="store_true", help="Only report prompt sizes")
+    asyncio.run(run(parser.parse_args()))
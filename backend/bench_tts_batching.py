@@ -0,0 +1,77 @@
+# bench_tts_batching.py — Throughput of batched vs unbatched MMS Tajik TTS
+#
+#   python bench_tts_batching.py --model-path /path/to/mms-tts-tgk
+#   python bench_tts_batching.py --model-path ... --sessions 8 --rounds 3 --max-batch 8
+#
+# Unbatched: each sentence gets its own forward pass, one at a time (the per-session
+# MMSTTSTajik path). Batched: every session submits at once through TTSBatchScheduler.
+import argparse
+import asyncio
+import time
+
+import torch
+
+from mms_tts_tajik import load_mms_model
+from tts_batcher import TTSBatchScheduler
+
+SENTENCES = [
+    "Салом.",
+    "Ташаккури зиёд.",
+    "Вохӯрӣ соати чанд сар мешавад?",
+    "Ба ман кӯмак лозим аст, лутфан.",
+    "Дар ин ҷо дорухона дар куҷост?",
+    "Ман бояд вохӯрии худро барои фардо ба вақти дигар гузорам.",
+    "Метавонед лутфан ба ман роҳи истгоҳро нишон диҳед?",
+    "Субҳ ба хайр. Ман барои вохӯрӣ бо доктор Смит омадаам.",
+]
+
+
+def bench_unbatched(scheduler: TTSBatchScheduler, texts):
+    start = time.perf_counter()
+    audio = sum(len(scheduler.synthesize_batch([t])[0]) for t in texts)
+    return time.perf_counter() - start, audio
+
+
+async def bench_batched(scheduler: TTSBatchScheduler, texts):
+    start = time.perf_counter()
+    waveforms = await asyncio.gather(*(scheduler.synthesize(t) for t in texts))
+    elapsed = time.perf_counter() - start
+    await scheduler.stop()
+    return elapsed, sum(len(w) for w in waveforms)
+
+
+def report(label: str, elapsed: float, samples: int, sample_rate: int, sentences: int):
+    audio_secs = samples / sample_rate
+    print(
+        f"{label:10s} {elapsed:7.2f}s wall  {sentences / elapsed:6.1f} sentences/s  "
+        f"{audio_secs / elapsed:6.1f}x real time"
+    )
+    return elapsed
+
+
+def main(args):
+    device = args.device or ("mps" if torch.backends.mps.is_available() else "cpu")
+    tokenizer, model = load_mms_model(args.model_path, device)
+    scheduler = TTSBatchScheduler(tokenizer, model, device, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms)
+    sample_rate = model.config.sampling_rate
+
+    # One sentence per concurrent session, repeated for each round
+    texts = [SENTENCES[i % len(SENTENCES)] for i in range(args.sessions)] * args.rounds
+    print(f"🔊 {len(texts)} sentences, {args.sessions} sessions, device={device}, max_batch={args.max_batch}")
+
+    scheduler.synthesize_batch(SENTENCES[:2])  # warmup
+
+    unbatched = report("unbatched", *bench_unbatched(scheduler, texts), sample_rate, len(texts))
+    batched = report("batched", *asyncio.run(bench_batched(scheduler, texts)), sample_rate, len(texts))
+    print(f"⚡ {unbatched / batched:.2f}x throughput, mean batch {scheduler.stats()['mean_batch_size']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of batched vs unbatched MMS Tajik TTS")
+    parser.add_argument("--model-path", required=True, help="Local mms-tts-tgk model directory")
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent sessions submitting sentences (default: 8)")
+    parser.add_argument("--rounds", type=int, default=3, help="Sentences per session (default: 3)")
+    parser.add_argument("--max-batch", type=int, default=8, help="Scheduler batch size (default: 8)")
+    parser.add_argument("--max-wait-ms", type=float, default=20.0, help="Scheduler wait budget (default: 20)")
+    parser.add_argument("--device", help="torch device (default: mps if available, else cpu)")
+    main(parser.parse_args())
@@ -1,349 +1,256 @@
 import argparse
 import asyncio
+import json
 import os
 import sys
+import threading
+import time
 from contextlib import asynccontextmanager
-from typing import Dict
+from typing import Awaitable, Callable, Dict, Optional
 
 # Add local pipecat to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "pipecat", "src"))
 
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import BackgroundTasks, FastAPI
+from fastapi import BackgroundTasks, FastAPI, File, HTTPException, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, JSONResponse
 from loguru import logger
 
-# ✅ USE REAL PIPECAT SMART TURN V3
-from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
-from pipecat.audio.vad.silero import SileroVADAnalyzer
-from pipecat.audio.vad.vad_analyzer import VADParams
-from pipecat.pipeline.pipeline import Pipeline
-from pipecat.pipeline.runner import PipelineRunner
-from pipecat.pipeline.task import PipelineParams, PipelineTask
-from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
-from pipecat.services.openai.llm import OpenAILLMService
-from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
-from pipecat.frames.frames import (
-    Frame, 
-    TranscriptionFrame, 
-    LLMContextFrame, 
-    TextFrame,
-    LLMFullResponseStartFrame,
-    LLMFullResponseEndFrame,
-    TTSSpeakFrame
-)
-import re
+# ⚡ Only light modules at import time - pipecat, torch, transformers, MLX Whisper,
+# Silero and Smart Turn are imported by the code paths that use them and preloaded
+# in the background after startup (see _preload_models)
+from pipeline_pool import PipelinePool, ReadyTimes, WarmComponents
+from translation_memory import TranslationMemory
+from tajik_detector import TajikBypassStats, detect_tajik
+from turn_tracker import BargeInStats
+from audio_jobs import AudioJobManager
 
-# 🌏 MULTILINGUAL STT (Your working model)
-from pipecat.services.whisper.stt import WhisperSTTServiceMLX, MLXModel
+# 🎯 FINAL UNIVERSAL TRANSLATION PROMPT - assembled per input script
+from prompt_builder import MAX_TOKENS, build_system_prompt, clean_translation_output, estimate_max_tokens
 
-# 🇹🇯 TAJIK TTS (Your existing)
-from mms_tts_tajik import MMSTTSTajik
+# 🇹🇯 ALREADY-TAJIK FAST PATH - counts of inputs that skipped the LLM
+tajik_bypass_stats = TajikBypassStats()
 
-from pipecat.transports.base_transport import TransportParams
-from pipecat.processors.frameworks.rtvi import RTVIConfig, RTVIObserver, RTVIProcessor
-from pipecat.transports.network.small_webrtc import SmallWebRTCTransport
-from pipecat.transports.network.webrtc_connection import IceServer, SmallWebRTCConnection
+# ✋ BARGE-IN - work reclaimed by cancelling superseded turns (all sessions)
+barge_in_stats = BargeInStats()
 
 load_dotenv(override=True)
 
-app = FastAPI()
-
-pcs_map: Dict[str, SmallWebRTCConnection] = {}
+# 🩺 What has been loaded so far - reported by /health/ready. False while loading,
+# True once loaded, or the error message if loading it failed (in load order)
+component_status: Dict[str, object] = {
+    "pipecat": False,
+    "vad": False,
+    "smart_turn": False,
+    "pipeline": False,
+}
+_preload_task: Optional[asyncio.Task] = None
 
-ice_servers = [
-    IceServer(
-        urls="stun:stun.l.google.com:19302",
-    )
-]
+# How long to wait for the first warm pipeline before reporting it as failed
+PRELOAD_TIMEOUT_SECS = float(os.getenv("PRELOAD_TIMEOUT_SECS", "300"))
 
-# 🎯 FINAL UNIVERSAL TRANSLATION PROMPT
-TRANSLATOR_SYSTEM_PROMPT = """You are a highly advanced translation engine. Your sole function is to translate text from ANY source language into precise, natural Tajik.
 
-**CORE DIRECTIVE:**
-1. Auto-detect the source language
-2. Translate the input into Tajik
-3. If already in Tajik, return it unchanged
+def _import_heavy_modules():
+    """Import everything the voice pipeline needs (blocking)"""
+    import translation_processors  # noqa: F401 - pulls in pipecat frames/processors
+    import mms_tts_tajik  # noqa: F401 - torch + transformers
+    from pipecat.services.whisper.stt import WhisperSTTServiceMLX  # noqa: F401
+    from pipecat.transports.network.small_webrtc import SmallWebRTCTransport  # noqa: F401
+    from pipecat.pipeline.task import PipelineTask  # noqa: F401
 
-**STRICT PROHIBITIONS:**
-❌ Do not add any text before or after the translation
-❌ Do not add labels like "Translation:", "Тарҷума:", "Here is:"
-❌ Do not explain, apologize, or add context
-❌ Do not answer questions—translate them literally
-❌ Do not include parenthetical notes, alternatives, or footnotes
-❌ Do not output <think> tags or internal reasoning
-❌ Do not add conversational responses like "Ман туро мешунавам..."
-❌ Do not add dialogue attribution like "- Падар (ба писар)"
-❌ Do not alter the meaning, tone, or intent
-❌ Do not correct errors in the source—translate as-is
 
-**MANDATORY ACTIONS:**
-✅ Preserve exact meaning and nuance
-✅ Maintain original tone (formal/informal/slang)
-✅ Output ONLY the clean Tajik translation
+def _turn_analyzer_classes():
+    """VAD and turn analyzer classes - batched across sessions unless disabled"""
+    if BATCHED_TURN_INFERENCE:
+        from batched_inference import BatchedSileroVADAnalyzer, BatchedSmartTurnAnalyzerV3
+        return BatchedSileroVADAnalyzer, BatchedSmartTurnAnalyzerV3
 
----
+    from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+    from pipecat.audio.vad.silero import SileroVADAnalyzer
+    return SileroVADAnalyzer, LocalSmartTurnAnalyzerV3
 
-**CORRECT EXAMPLES:**
 
-**English:**
-Input: "I need to reschedule my appointment for tomorrow."
-Output: Ман бояд вохӯрии худро барои фардо ба вақти дигар гузорам.
+def _load_turn_models():
+    """Instantiate the per-connection analyzers once so their ONNX models are cached"""
+    vad_class, turn_class = _turn_analyzer_classes()
 
-**Russian:**
-Input: "Во сколько начинается встреча?"
-Output: Вохӯрӣ соати чанд сар мешавад?
+    vad_class()
+    component_status["vad"] = True
+    turn_class()
+    component_status["smart_turn"] = True
 
-**Chinese:**
-Input: "这个多少钱？"
-Output: Ин чанд пул аст?
 
-**Spanish:**
-Input: "Necesito ayuda, por favor."
-Output: Ба ман кӯмак лозим аст, лутфан.
+async def _preload_models():
+    """Background preload after startup - HTTP endpoints are served meanwhile"""
+    start = time.perf_counter()
+    try:
+        # 📚 Re-index persisted translations - lookups just miss until this is done
+        await asyncio.to_thread(translation_memory.load)
+    except Exception as e:
+        logger.error(f"Translation memory load failed: {e}")
 
-**German (Formal):**
-Input: "Könnten Sie mir bitte den Weg zum Bahnhof zeigen?"
-Output: Метавонед лутфан ба ман роҳи истгоҳро нишон диҳед?
+    try:
+        await asyncio.to_thread(_import_heavy_modules)
+        component_status["pipecat"] = True
+        logger.info(f"📦 Pipeline modules imported in {time.perf_counter() - start:.2f}s")
 
-**Arabic:**
-Input: "شكرا جزيلا"
-Output: Ташаккури зиёд.
+        await asyncio.to_thread(_load_turn_models)
 
-**English (Informal Slang):**
-Input: "That's awesome!"
-Output: Ин олӣ аст!
+        await pipeline_pool.start()
+        if not await pipeline_pool.wait_ready(PRELOAD_TIMEOUT_SECS):
+            component_status["pipeline"] = (
+                f"not ready after {PRELOAD_TIMEOUT_SECS:.0f}s: "
+                f"{pipeline_pool.last_error or 'still building'}"
+            )
+            logger.error(f"Warm pipeline {component_status['pipeline']}")
+            # The pool keeps retrying failed builds - report ready if one succeeds
+            await pipeline_pool.wait_ready()
+        component_status["pipeline"] = True
+        logger.info(f"✅ All models preloaded in {time.perf_counter() - start:.2f}s")
+    except Exception as e:
+        failed = next((name for name, status in component_status.items() if status is False), "pipeline")
+        component_status[failed] = f"failed: {e}"
+        logger.error(f"Model preload failed at {failed}: {e}")
 
-**Multi-sentence:**
-Input: "Good morning. I'm here to see Dr. Smith. Is he available?"
-Output: Субҳ ба хайр. Ман барои вохӯрӣ бо доктор Смит омадаам. Оё ӯ дар ҷо аст?
 
-**Already Tajik:**
-Input: "Ин як ҷумлаи тоҷикӣ аст."
-Output: Ин як ҷумлаи тоҷикӣ аст.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _preload_task
+    _preload_task = asyncio.create_task(_preload_models())
+    yield
+    _preload_task.cancel()
+    await pipeline_pool.stop()
+    if _tts_scheduler:
+        await _tts_scheduler.stop()
+    await audio_job_manager.stop()
+    coros = [pc.disconnect() for pc in pcs_map.values()]
+    await asyncio.gather(*coros)
+    pcs_map.clear()
+    translation_memory.close()
 
----
 
-**INCORRECT EXAMPLES (NEVER DO THIS):**
+app = FastAPI(lifespan=lifespan)
 
-Input: "Где здесь аптека?"
-Wrong: Тарҷума аз русӣ: Дар ин ҷо дорухона дар куҷост? ❌
-Correct: Дар ин ҷо дорухона дар куҷост?
+pcs_map: Dict[str, "SmallWebRTCConnection"] = {}
 
-Input: "Hello?"
-Wrong: Салом! Ман туро мешунавам, ту ҷастухез намекунӣ. ❌
-Correct: Салом?
+ICE_SERVER_URLS = ["stun:stun.l.google.com:19302"]
 
-Input: "He will arrive soon."
-Wrong: Ӯ зуд мерасад (дар тавзеҳот омадааст: дар роҳ аст) ❌
-Correct: Ӯ зуд мерасад.
+# 📚 TRANSLATION MEMORY - reuse past translations for near-identical input
+translation_memory = TranslationMemory(
+    path=os.getenv("TRANSLATION_MEMORY_PATH", os.path.join(os.path.dirname(__file__), "translation_memory.db")),
+    threshold=float(os.getenv("TRANSLATION_MEMORY_THRESHOLD", "0.85")),
+)
 
-Input: "Do you hear me?"
-Wrong: <think>This is a question</think> Оё шумо маро мешунавед? ❌
-Correct: Оё шумо маро мешунавед?
+# 🔬 FRAME TRACER - opt-in per-processor frame timeline, dumped via /api/trace/{pc_id}
+FRAME_TRACE_ENABLED = os.getenv("FRAME_TRACE", "0") == "1"
+FRAME_TRACE_BUFFER = int(os.getenv("FRAME_TRACE_BUFFER", "20000"))
+FRAME_TRACE_AUDIO = os.getenv("FRAME_TRACE_AUDIO", "0") == "1"
+_trace_registry = None
+
+
+def _get_trace_registry():
+    global _trace_registry
+    if _trace_registry is None:
+        from frame_tracer import TraceRegistry
+        _trace_registry = TraceRegistry(max_events=FRAME_TRACE_BUFFER)
+    return _trace_registry
+
+
+# 🧮 BATCHED VAD / SMART TURN - one shared ONNX forward pass for all sessions' chunks
+# (latency budget and batch size: VAD_BATCH_* / TURN_BATCH_* in batched_inference.py)
+BATCHED_TURN_INFERENCE = os.getenv("BATCHED_TURN_INFERENCE", "1") == "1"
+
+# 🔥 WARM POOL - number of pre-built pipelines kept ready for new connections
+PIPELINE_POOL_SIZE = int(os.getenv("PIPELINE_POOL_SIZE", "1"))
+
+LLM_BASE_URL = "http://10.85.58.171:1234/v1"
+LLM_MODEL = "ameena_qwen3-8b"
+TTS_MODEL_PATH = "/Users/tohirsaidzoda/voice-agent-workspace/models/mms-tts-tgk"
+
+# 🧮 BATCHED TTS - one VITS model shared by all sessions, sentences batched per forward pass
+TTS_BATCHING = os.getenv("TTS_BATCHING", "1") == "1"
+TTS_BATCH_MAX_WAIT_MS = float(os.getenv("TTS_BATCH_MAX_WAIT_MS", "20"))
+TTS_BATCH_MAX_SIZE = int(os.getenv("TTS_BATCH_MAX_SIZE", "8"))
+_tts_scheduler = None
+_tts_scheduler_lock = threading.Lock()
+
+
+def _get_tts_scheduler():
+    """Shared TTSBatchScheduler, loading the model on first use (blocking)"""
+    global _tts_scheduler
+    with _tts_scheduler_lock:
+        if _tts_scheduler is None:
+            import torch
+            from mms_tts_tajik import load_mms_model
+            from tts_batcher import TTSBatchScheduler
+
+            device = "mps" if torch.backends.mps.is_available() else "cpu"
+            tokenizer, model = load_mms_model(TTS_MODEL_PATH, device)
+            _tts_scheduler = TTSBatchScheduler(
+                tokenizer,
+                model,
+                device,
+                max_batch=TTS_BATCH_MAX_SIZE,
+                max_wait_ms=TTS_BATCH_MAX_WAIT_MS,
+            )
+    return _tts_scheduler
 
-Input: "Can I speak with Mr. John?"
-Wrong: Оё ман бо ҷаноби Ҷон гап зада метавонам? - Падар (ба писар) ❌
-Correct: Оё ман бо ҷаноби Ҷон гап зада метавонам?
 
----
+# 🔒 MLX is not thread-safe - the live pipelines' Whisper and the offline jobs share this
+MLX_WHISPER_LOCK = threading.Lock()
 
-**FINAL INSTRUCTION:**
-Your entire response must consist ONLY of the Tajik translation. Nothing else."""
 
+def _serialize_mlx_whisper():
+    """Route pipecat's mlx_whisper.transcribe calls through MLX_WHISPER_LOCK (idempotent)"""
+    import mlx_whisper
 
-def clean_translation_output(text: str) -> str:
-    """🧹 AGGRESSIVE CLEANING - Remove ALL non-translation content"""
-    if not text:
-        return ""
-    
-    # Remove thinking tags
-    text = re.sub(r'<think[^>]*>.*?</think>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'</?think[^>]*>', '', text, flags=re.IGNORECASE)
-    
-    # Remove common prefixes/labels
-    text = re.sub(r'^(Translation:|Output:|Тарҷума:|Text:|Input:|Wrong:|Correct:)\s*', '', text, flags=re.IGNORECASE)
-    
-    # Remove parenthetical explanations
-    text = re.sub(r'\([^)]*тавзеҳот[^)]*\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\([^)]*омадааст[^)]*\)', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\s*-\s*Падар.*$', '', text, flags=re.IGNORECASE)  # Remove dialogue attribution
-    
-    # Remove extra explanatory phrases
-    text = re.sub(r'Ман туро мешунавам[^.]*\.', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'(буданаш маълум шуд|дар рӯшноӣ)', '', text, flags=re.IGNORECASE)
-    
-    # Clean whitespace and punctuation
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'\s+([,.!?])', r'\1', text)  # Fix spacing before punctuation
-    text = text.strip()
-    
-    logger.info(f"🧹 Cleaned: '{text}'")
-    return text
+    if getattr(mlx_whisper.transcribe, "_serialized", False):
+        return
+    transcribe = mlx_whisper.transcribe
 
+    def locked_transcribe(*args, **kwargs):
+        with MLX_WHISPER_LOCK:
+            return transcribe(*args, **kwargs)
 
-class TranslationAggregator(FrameProcessor):
-    """
-    Aggregates all text frames from LLM response into one complete translation,
-    then sends it as a single frame to TTS.
-    """
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.current_text = ""
-        self.collecting = False
-        
-    async def process_frame(self, frame: Frame, direction: FrameDirection):
-        await super().process_frame(frame, direction)
-        
-        if isinstance(frame, LLMFullResponseStartFrame):
-            # Start collecting text
-            self.current_text = ""
-            self.collecting = True
-            logger.info("📄 Started collecting LLM response...")
-            
-        elif isinstance(frame, TextFrame) and self.collecting:
-            # Accumulate text from LLM
-            self.current_text += frame.text
-            logger.info(f"📝 Accumulated: '{frame.text}' (total: {len(self.current_text)} chars)")
-            # Don't pass individual frames to TTS yet
-            
-        elif isinstance(frame, LLMFullResponseEndFrame):
-            # LLM finished - clean and send complete translation
-            self.collecting = False
-            
-            if self.current_text.strip():
-                cleaned_text = clean_translation_output(self.current_text)
-                
-                if cleaned_text:
-                    logger.info(f"✅ Complete translation: '{cleaned_text}'")
-                    
-                    # Send complete translation as TTSSpeakFrame
-                    await self.push_frame(TTSSpeakFrame(text=cleaned_text), direction)
-                else:
-                    logger.warning("⚠️ Empty translation after cleaning")
-            else:
-                logger.warning("⚠️ No text collected from LLM")
-                
-            # Reset for next translation
-            self.current_text = ""
-            
-        elif not isinstance(frame, TextFrame):
-            # Pass through all non-text frames normally
-            await self.push_frame(frame, direction)
-
-
-class StatelessTranslationProcessor(FrameProcessor):
-    """
-    🧠 MEMORY-ENABLED: Accumulates user speech before translating.
-    Waits for user to stop speaking, then translates complete text.
-    """
-    
-    def __init__(self, llm_service: OpenAILLMService, **kwargs):
-        super().__init__(**kwargs)
-        self.llm = llm_service
-        
-        # 🧠 MEMORY: Accumulate user's speech
-        self.speech_buffer = []
-        self.last_transcription_time = None
-        self.translation_task = None
-        self.pause_threshold = 1.5  # Wait 1.5 seconds of silence before translating
-        
-    async def process_frame(self, frame: Frame, direction: FrameDirection):
-        await super().process_frame(frame, direction)
-        
-        if isinstance(frame, TranscriptionFrame):
-            user_text = frame.text.strip()
-            if not user_text:
-                return
-            
-            # 📝 Add to speech buffer
-            self.speech_buffer.append(user_text)
-            self.last_transcription_time = asyncio.get_event_loop().time()
-            
-            logger.info(f"📝 Buffered: '{user_text}' (total segments: {len(self.speech_buffer)})")
-            
-            # Cancel previous translation task if still waiting
-            if self.translation_task and not self.translation_task.done():
-                self.translation_task.cancel()
-            
-            # Schedule translation after pause
-            self.translation_task = asyncio.create_task(
-                self._wait_and_translate(direction)
-            )
-            
-        else:
-            # Pass through all other frames
-            await self.push_frame(frame, direction)
-    
-    async def _wait_and_translate(self, direction: FrameDirection):
-        """Wait for pause, then translate accumulated speech"""
-        try:
-            await asyncio.sleep(self.pause_threshold)
-            
-            # Check if we still have the latest transcription
-            current_time = asyncio.get_event_loop().time()
-            if current_time - self.last_transcription_time >= self.pause_threshold:
-                await self._translate_buffer(direction)
-                
-        except asyncio.CancelledError:
-            # New speech arrived, this task is cancelled
-            pass
-    
-    async def _translate_buffer(self, direction: FrameDirection):
-        """Translate all accumulated speech as one text"""
-        if not self.speech_buffer:
-            return
-        
-        # 🎯 Combine all speech segments with spaces
-        complete_text = " ".join(self.speech_buffer).strip()
-        
-        logger.info(f"🎯 TRANSLATING COMPLETE SPEECH: '{complete_text}'")
-        logger.info(f"📊 Total segments combined: {len(self.speech_buffer)}")
-        
-        # Clear buffer
-        self.speech_buffer = []
-        
-        # Create fresh context with complete text
-        fresh_context = OpenAILLMContext([
-            {"role": "system", "content": TRANSLATOR_SYSTEM_PROMPT},
-            {"role": "user", "content": complete_text}
-        ])
-        
-        # Send to LLM
-        await self.push_frame(LLMContextFrame(context=fresh_context), direction)
+    locked_transcribe._serialized = True
+    mlx_whisper.transcribe = locked_transcribe
 
 
-async def run_bot(webrtc_connection):
-    transport = SmallWebRTCTransport(
-        webrtc_connection=webrtc_connection,
-        params=TransportParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            
-            # ✅ Smart Turn v3 requires VAD with 0.2 seconds
-            vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.2)),
-            turn_analyzer=LocalSmartTurnAnalyzerV3(),
-        ),
-    )
+def _create_services() -> Dict[str, object]:
+    """Build STT, TTS, LLM and translation processors (blocking - loads models)"""
+    from pipecat.services.openai.llm import OpenAILLMService
+    # 🌏 MULTILINGUAL STT (Your working model)
+    from pipecat.services.whisper.stt import WhisperSTTServiceMLX, MLXModel
+    # 🇹🇯 TAJIK TTS (Your existing)
+    from mms_tts_tajik import MMSTTSTajik
+    from translation_processors import StatelessTranslationProcessor, TranslationAggregator
+    from turn_tracker import TurnTracker
 
     # 🌏 MULTILINGUAL STT - Fixed to transcribe (not translate)
+    _serialize_mlx_whisper()
     stt = WhisperSTTServiceMLX(
         model=MLXModel.LARGE_V3_TURBO_Q4,
         language=None  # Auto-detect language, don't force English
     )
 
+    # ✋ Shared by processor, aggregator and TTS so barge-in can cancel the in-flight turn
+    turn_tracker = TurnTracker(barge_in_stats)
+
     # 🇹🇯 TAJIK TTS - Your existing model
     tts = MMSTTSTajik(
-        model_path="/Users/tohirsaidzoda/voice-agent-workspace/models/mms-tts-tgk"
+        model_path=TTS_MODEL_PATH,
+        on_synthesis_cancelled=barge_in_stats.tts_synthesis_cancelled,
+        on_audio_started=turn_tracker.audio_started,
+        scheduler=_get_tts_scheduler() if TTS_BATCHING else None
     )
 
     # 📄 TRANSLATION LLM - Optimized settings
     llm = OpenAILLMService(
         api_key="dummyKey",
-        model="ameena_qwen3-8b",
-        base_url="http://10.85.58.171:1234/v1",
-        max_tokens=150,  # Shorter - translations shouldn't be long
+        model=LLM_MODEL,
+        base_url=LLM_BASE_URL,
+        max_tokens=MAX_TOKENS,  # Shorter - translations shouldn't be long
         extra_body={
             "stop": ["<think>", "</think>", "\n\n", "Input:", "Wrong:", "Correct:"],  # Stop on prompt leakage
             "temperature": 0.05,  # Even lower - be more deterministic
@@ -355,10 +262,116 @@ async def run_bot(webrtc_connection):
     )
 
     # 📄 MEMORY-ENABLED TRANSLATION PROCESSOR
-    translation_processor = StatelessTranslationProcessor(llm)
-    
+    translation_processor = StatelessTranslationProcessor(
+        llm,
+        translation_memory=translation_memory,
+        turn_tracker=turn_tracker,
+        tajik_bypass_stats=tajik_bypass_stats
+    )
+
     # 📚 TRANSLATION AGGREGATOR - Collects complete LLM response
-    translation_aggregator = TranslationAggregator()
+    translation_aggregator = TranslationAggregator(
+        translation_memory=translation_memory,
+        turn_tracker=turn_tracker,
+        on_truncated=translation_processor.retranslate
+    )
+
+    return {
+        "stt": stt,
+        "tts": tts,
+        "llm": llm,
+        "translation_processor": translation_processor,
+        "translation_aggregator": translation_aggregator,
+    }
+
+
+async def _warmup_services(services: Dict[str, object]):
+    """Run one throwaway inference through each model so the first turn is fast"""
+    # 🇹🇯 TTS - first VITS forward pass compiles kernels / allocates buffers
+    try:
+        await asyncio.to_thread(services["tts"]._generate_speech, "Салом")
+    except Exception as e:
+        logger.warning(f"TTS warmup failed: {e}")
+
+    # 🌏 STT - half a second of silence forces the Whisper model to load
+    try:
+        async for _ in services["stt"].run_stt(b"\x00\x00" * 8000):
+            pass
+    except Exception as e:
+        logger.warning(f"STT warmup failed: {e}")
+
+    # 📄 LLM - prime the server's prompt cache with the system prompt
+    try:
+        import aiohttp
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                f"{LLM_BASE_URL}/chat/completions",
+                json={
+                    "model": LLM_MODEL,
+                    "messages": [
+                        {"role": "system", "content": build_system_prompt("Hello")},
+                        {"role": "user", "content": "Hello"}
+                    ],
+                    "max_tokens": 1,
+                },
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                await response.read()
+    except Exception as e:
+        logger.warning(f"LLM warmup failed: {e}")
+
+
+async def build_warm_components() -> WarmComponents:
+    """Pool factory: build and warm one set of pipeline services"""
+    start = time.perf_counter()
+    services = await asyncio.to_thread(_create_services)
+    built = time.perf_counter()
+    await _warmup_services(services)
+    return WarmComponents(
+        services=services,
+        build_secs=built - start,
+        warmup_secs=time.perf_counter() - built,
+    )
+
+
+pipeline_pool = PipelinePool(build_warm_components, size=PIPELINE_POOL_SIZE)
+ready_times = ReadyTimes()
+
+
+async def run_bot(webrtc_connection, offer_received_at: float = None):
+    from pipecat.audio.vad.vad_analyzer import VADParams
+    from pipecat.pipeline.pipeline import Pipeline
+    from pipecat.pipeline.runner import PipelineRunner
+    from pipecat.pipeline.task import PipelineParams, PipelineTask
+    from pipecat.processors.frameworks.rtvi import RTVIConfig, RTVIObserver, RTVIProcessor
+    from pipecat.transports.base_transport import TransportParams
+    from pipecat.transports.network.small_webrtc import SmallWebRTCTransport
+
+    if offer_received_at is None:
+        offer_received_at = time.perf_counter()
+
+    # ✅ USE REAL PIPECAT SMART TURN V3
+    vad_class, turn_class = _turn_analyzer_classes()
+
+    components = await pipeline_pool.acquire()
+    services = components.services
+    stt = services["stt"]
+    tts = services["tts"]
+    llm = services["llm"]
+    translation_processor = services["translation_processor"]
+    translation_aggregator = services["translation_aggregator"]
+
+    transport = SmallWebRTCTransport(
+        webrtc_connection=webrtc_connection,
+        params=TransportParams(
+            audio_in_enabled=True,
+            audio_out_enabled=True,
+            
+            # ✅ Smart Turn v3 requires VAD with 0.2 seconds
+            vad_analyzer=vad_class(params=VADParams(stop_secs=0.2)),
+            turn_analyzer=turn_class(),
+        ),
+    )
 
     rtvi = RTVIProcessor(config=RTVIConfig(config=[]))
 
@@ -373,19 +386,31 @@ async def run_bot(webrtc_connection):
         transport.output(),
     ])
 
+    observers = [RTVIObserver(rtvi)]
+    if FRAME_TRACE_ENABLED:
+        # Not attached at all when disabled - zero per-frame overhead
+        from frame_tracer import FrameTraceObserver
+        session_trace = _get_trace_registry().session(webrtc_connection.pc_id)
+        observers.append(FrameTraceObserver(session_trace, include_audio=FRAME_TRACE_AUDIO))
+
     task = PipelineTask(
         pipeline,
         params=PipelineParams(
             enable_metrics=True,
             enable_usage_metrics=True,
         ),
-        observers=[RTVIObserver(rtvi)],
+        observers=observers,
     )
 
     @rtvi.event_handler("on_client_ready")
     async def on_client_ready(rtvi):
         await rtvi.set_bot_ready()
-        logger.info("🎯 PRODUCTION Translation bot ready!")
+        time_to_ready = time.perf_counter() - offer_received_at
+        ready_times.record(webrtc_connection.pc_id, time_to_ready, warm=components.warm)
+        logger.info(
+            f"🎯 PRODUCTION Translation bot ready! "
+            f"(time-to-ready {time_to_ready:.2f}s, {'warm' if components.warm else 'cold'} pipeline)"
+        )
 
     @transport.event_handler("on_first_participant_joined")
     async def on_first_participant_joined(transport, participant):
@@ -400,6 +425,116 @@ async def run_bot(webrtc_connection):
     runner = PipelineRunner(handle_sigint=False)
     await runner.run(task)
 
+
+async def _translate(
+    text: str,
+    path: str = "text",
+    on_partial: Optional[Callable[[str], Awaitable[None]]] = None,
+    remember: bool = True
+) -> dict:
+    """
+    Translate one text: Tajik fast path, translation memory, then the LLM.
+    With remember=False the result is not stored in the translation memory.
+    """
+    # 🇹🇯 Already Tajik - return it unchanged without calling the LLM
+    detection = detect_tajik(text)
+    tajik_bypass_stats.record(path, detection.is_tajik)
+    if detection.is_tajik:
+        return {
+            "translation": text.strip(),
+            "original": text,
+            "bypassed": True
+        }
+    
+    # 📚 Reuse a stored translation for near-identical input
+    match = translation_memory.lookup(text)
+    if match:
+        return {
+            "translation": match.target,
+            "original": text,
+            "cached": True,
+            "similarity": round(match.similarity, 3)
+        }
+    
+    max_tokens = estimate_max_tokens(text)
+    translation, finish_reason = await _call_llm(text, max_tokens, on_partial)
+    if finish_reason == "length" and max_tokens < MAX_TOKENS:
+        # ✂️ Cut off by the scaled budget - retry with the full one
+        logger.warning(f"✂️ Translation hit max_tokens={max_tokens}, retrying with {MAX_TOKENS}")
+        translation, finish_reason = await _call_llm(text, MAX_TOKENS, on_partial)
+    truncated = finish_reason == "length"
+    
+    cleaned = clean_translation_output(translation)
+    if cleaned and not truncated and remember:
+        translation_memory.add(text, cleaned)
+    
+    result = {
+        "translation": cleaned,
+        "original": text
+    }
+    if truncated:
+        result["truncated"] = True
+    return result
+
+
+async def _call_llm(
+    text: str,
+    max_tokens: int,
+    on_partial: Optional[Callable[[str], Awaitable[None]]] = None
+):
+    """One chat completion - returns (raw translation, finish_reason)"""
+    payload = {
+        "model": LLM_MODEL,
+        "messages": [
+            {"role": "system", "content": build_system_prompt(text)},
+            {"role": "user", "content": text}
+        ],
+        "max_tokens": max_tokens,
+        "temperature": 0.05,
+        "top_p": 0.85
+    }
+    
+    # Call LM Studio
+    import aiohttp
+    finish_reason = None
+    async with aiohttp.ClientSession() as session:
+        if on_partial is None:
+            async with session.post(
+                f"{LLM_BASE_URL}/chat/completions",
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                result = await response.json()
+                translation = result["choices"][0]["message"]["content"]
+                finish_reason = result["choices"][0].get("finish_reason")
+        else:
+            # 🌊 Stream tokens so partial translations can be shown while typing.
+            # Cancelling this coroutine closes the connection and stops generation.
+            payload["stream"] = True
+            payload["stop"] = ["<think>", "</think>", "\n\n", "Input:", "Wrong:", "Correct:"]
+            translation = ""
+            async with session.post(
+                f"{LLM_BASE_URL}/chat/completions",
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                async for raw_line in response.content:
+                    line = raw_line.decode("utf-8").strip()
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    choice = json.loads(data)["choices"][0]
+                    finish_reason = choice.get("finish_reason") or finish_reason
+                    delta = choice.get("delta", {}).get("content")
+                    if delta:
+                        translation += delta
+                        await on_partial(translation.strip())
+    
+    return translation, finish_reason
+
+
 # ✅ TEXT-ONLY TRANSLATION ENDPOINT
 @app.post("/api/translate")
 async def translate_text(request: dict):
@@ -409,38 +544,215 @@ async def translate_text(request: dict):
         if not text:
             return {"error": "No text provided"}
         
-        # Call LM Studio
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "http://10.85.58.171:1234/v1/chat/completions",
-                json={
-                    "model": "ameena_qwen3-8b",
-                    "messages": [
-                        {"role": "system", "content": TRANSLATOR_SYSTEM_PROMPT},
-                        {"role": "user", "content": text}
-                    ],
-                    "max_tokens": 150,
-                    "temperature": 0.05,
-                    "top_p": 0.85
-                },
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                result = await response.json()
-                translation = result["choices"][0]["message"]["content"]
-                cleaned = clean_translation_output(translation)
-                
-                return {
-                    "translation": cleaned,
-                    "original": text
-                }
+        return await _translate(text)
                 
     except Exception as e:
         logger.error(f"Translation error: {e}")
         return {"error": str(e)}
 
+
+# ⌨️ TRANSLATE-AS-YOU-TYPE - wait this long after the last keystroke before calling the LLM
+WS_DEBOUNCE_SECS = float(os.getenv("WS_DEBOUNCE_SECS", "0.3"))
+
+ws_translate_stats = {
+    "connections": 0,
+    "messages": 0,
+    "debounced": 0,      # superseded before reaching the LLM
+    "llm_cancelled": 0,  # superseded while the LLM was generating
+    "completed": 0,
+    "committed": 0,
+    "invalid": 0,
+}
+
+
+async def _debounced_ws_translation(websocket: WebSocket, request_id, text: str, finals: dict):
+    """Translate the latest text after a quiet period, streaming partials back"""
+    llm_started = False
+    try:
+        await asyncio.sleep(WS_DEBOUNCE_SECS)
+        llm_started = True
+        
+        async def send_partial(partial: str):
+            await websocket.send_json({"type": "partial", "id": request_id, "translation": partial})
+        
+        # 📚 Not remembered - it may be a half-typed word; stored only on commit
+        result = await _translate(text, path="ws", on_partial=send_partial, remember=False)
+        ws_translate_stats["completed"] += 1
+        finals.clear()
+        finals[request_id] = result
+        await websocket.send_json({"type": "final", "id": request_id, **result})
+        
+    except asyncio.CancelledError:
+        ws_translate_stats["llm_cancelled" if llm_started else "debounced"] += 1
+        raise
+    except Exception as e:
+        logger.error(f"WebSocket translation error: {e}")
+        await websocket.send_json({"type": "error", "id": request_id, "error": str(e)})
+
+
+@app.websocket("/ws/translate")
+async def translate_websocket(websocket: WebSocket):
+    """
+    One connection per client. Send {"id": ..., "text": ...} on every edit;
+    receives "partial" and "final" messages for the latest text only.
+    {"type": "cancel"} drops the pending request, and {"type": "commit", "id": ...}
+    stores that final translation in the translation memory.
+    """
+    await websocket.accept()
+    ws_translate_stats["connections"] += 1
+    pending: Optional[asyncio.Task] = None
+    finals: dict = {}  # latest final result, by request id
+    
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+                if not isinstance(message, dict) or not isinstance(message.get("text", ""), str):
+                    raise ValueError("expected an object with a string \"text\"")
+                if not isinstance(message.get("id"), (int, str, type(None))):
+                    raise ValueError("\"id\" must be a number or string")
+            except ValueError as e:  # includes JSONDecodeError
+                ws_translate_stats["invalid"] += 1
+                await websocket.send_json({"type": "error", "id": None, "error": f"Invalid message: {e}"})
+                continue
+            ws_translate_stats["messages"] += 1
+            message_type = message.get("type", "text")
+            
+            if message_type == "commit":
+                result = finals.pop(message.get("id"), None)
+                if result and not (result.get("bypassed") or result.get("cached") or result.get("truncated")):
+                    translation_memory.add(result["original"], result["translation"])
+                    ws_translate_stats["committed"] += 1
+                continue
+            
+            # Newer text (or a cancel) supersedes whatever is still waiting or generating
+            if pending and not pending.done():
+                pending.cancel()
+            if message_type == "cancel":
+                continue
+            
+            text = message.get("text", "").strip()
+            if text:
+                pending = asyncio.create_task(
+                    _debounced_ws_translation(websocket, message.get("id"), text, finals)
+                )
+                
+    except WebSocketDisconnect:
+        logger.info("🔌 Translate-as-you-type client disconnected")
+    finally:
+        if pending and not pending.done():
+            pending.cancel()
+
+
+# 🎞️ OFFLINE AUDIO JOBS - translate recorded files faster than real time
+_job_tts = None
+_job_tts_lock = threading.Lock()
+
+
+def _job_tts_unbatched(text: str):
+    """Tajik TTS for offline jobs with TTS_BATCHING=0 - own model, loaded on first use"""
+    global _job_tts
+    with _job_tts_lock:
+        if _job_tts is None:
+            from mms_tts_tajik import MMSTTSTajik
+            _job_tts = MMSTTSTajik(model_path=TTS_MODEL_PATH)
+    return _job_tts._generate_speech(text)
+
+
+async def _job_synthesize(text: str):
+    """Tajik TTS for offline jobs - batched with the live sessions on the shared model"""
+    if not TTS_BATCHING:
+        return await asyncio.to_thread(_job_tts_unbatched, text)
+
+    from mms_tts_tajik import join_sentences, split_sentences
+
+    scheduler = await asyncio.to_thread(_get_tts_scheduler)
+    return join_sentences(await scheduler.synthesize_many(split_sentences(text)))
+
+
+def _job_transcribe_batch(clips) -> list:
+    """
+    Batched Whisper decoding for offline jobs - every VAD segment fits one 30s
+    window, so a batch is a single decode() call. Uses the same cached model
+    as the live pipeline, under MLX_WHISPER_LOCK.
+    """
+    import mlx.core as mx
+    from mlx_whisper.audio import N_FRAMES, N_SAMPLES, log_mel_spectrogram, pad_or_trim
+    from mlx_whisper.decoding import DecodingOptions, decode
+    from mlx_whisper.transcribe import ModelHolder
+    from pipecat.services.whisper.stt import MLXModel
+
+    with MLX_WHISPER_LOCK:
+        model = ModelHolder.get_model(MLXModel.LARGE_V3_TURBO_Q4.value, mx.float16)
+        # Pad the audio, not the mel, as mlx_whisper.transcribe does - padded frames
+        # must be log-mel silence, not zeros
+        mels = mx.stack([
+            pad_or_trim(
+                log_mel_spectrogram(clip, n_mels=model.dims.n_mels, padding=N_SAMPLES), N_FRAMES, axis=-2
+            ).astype(mx.float16)
+            for clip in clips
+        ])
+        results = decode(model, mels, DecodingOptions(language=None, without_timestamps=True, fp16=True))
+
+    # Same silence rule as mlx_whisper.transcribe
+    return [
+        "" if r.no_speech_prob > 0.6 and r.avg_logprob < -1.0 else r.text.strip()
+        for r in results
+    ]
+
+
+async def _job_translate(text: str) -> str:
+    result = await _translate(text, path="job")
+    return result["translation"]
+
+
+audio_job_manager = AudioJobManager(
+    transcribe_batch=_job_transcribe_batch,
+    translate=_job_translate,
+    synthesize=_job_synthesize,
+    output_dir=os.getenv("TRANSLATION_JOBS_DIR"),
+    stt_batch_size=int(os.getenv("JOB_STT_BATCH_SIZE", "4")),
+    llm_workers=int(os.getenv("JOB_LLM_WORKERS", "8")),
+    tts_workers=int(os.getenv("JOB_TTS_WORKERS", "2")),
+    retention_secs=float(os.getenv("JOB_RETENTION_SECS", "3600")),
+)
+
+
+@app.post("/api/jobs")
+async def create_audio_job(file: UploadFile = File(...)):
+    """Start translating an uploaded audio file"""
+    data = await file.read()
+    if not data:
+        raise HTTPException(status_code=400, detail="Empty audio file")
+    job = audio_job_manager.submit(data, file.filename or "upload.wav")
+    return job.summary()
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_audio_job(job_id: str):
+    """Job progress, throughput and - once done - the timestamped transcript"""
+    job = audio_job_manager.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Unknown job")
+    return job.summary(include_segments=job.status == "done")
+
+
+@app.get("/api/jobs/{job_id}/audio")
+async def get_audio_job_audio(job_id: str):
+    """Translated Tajik audio, aligned to the source timeline"""
+    job = audio_job_manager.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Unknown job")
+    if job.status != "done":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    return FileResponse(job.output_path, media_type="audio/wav", filename=f"{job.id}.wav")
+
+
 @app.post("/api/offer")
 async def offer(request: dict, background_tasks: BackgroundTasks):
+    from pipecat.transports.network.webrtc_connection import IceServer, SmallWebRTCConnection
+
+    offer_received_at = time.perf_counter()
     pc_id = request.get("pc_id")
 
     if pc_id and pc_id in pcs_map:
@@ -452,6 +764,7 @@ async def offer(request: dict, background_tasks: BackgroundTasks):
             restart_pc=request.get("restart_pc", False),
         )
     else:
+        ice_servers = [IceServer(urls=url) for url in ICE_SERVER_URLS]
         pipecat_connection = SmallWebRTCConnection(ice_servers)
         await pipecat_connection.initialize(sdp=request["sdp"], type=request["type"])
 
@@ -460,19 +773,80 @@ async def offer(request: dict, background_tasks: BackgroundTasks):
             logger.info(f"🔌 Translator disconnected: {webrtc_connection.pc_id}")
             pcs_map.pop(webrtc_connection.pc_id, None)
 
-        background_tasks.add_task(run_bot, pipecat_connection)
+        background_tasks.add_task(run_bot, pipecat_connection, offer_received_at)
 
     answer = pipecat_connection.get_answer()
     pcs_map[answer["pc_id"]] = pipecat_connection
     return answer
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    yield
-    coros = [pc.disconnect() for pc in pcs_map.values()]
-    await asyncio.gather(*coros)
-    pcs_map.clear()
+@app.get("/health/live")
+async def health_live():
+    """The process is up and serving HTTP"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def health_ready():
+    """Ready once every pipeline component is loaded - /api/translate works before that"""
+    ready = all(status is True for status in component_status.values())
+    failed = any(isinstance(status, str) for status in component_status.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "failed" if failed else "loading",
+            "components": component_status,
+            "pool": pipeline_pool.stats(),
+        },
+    )
+
+
+@app.get("/api/metrics")
+async def metrics():
+    """LLM-skipping fast path, barge-in and batched inference counters"""
+    return {
+        "tajik_bypass": tajik_bypass_stats.stats(),
+        "translation_memory": translation_memory.stats(),
+        "barge_in": barge_in_stats.stats(),
+        "ws_translate": dict(ws_translate_stats),
+        "batched_inference": _batched_inference_stats(),
+        "tts_batching": _tts_scheduler.stats() if _tts_scheduler else None,
+    }
+
+
+def _batched_inference_stats():
+    # Only report once the analyzers (and so the shared batchers) exist
+    if not BATCHED_TURN_INFERENCE or "batched_inference" not in sys.modules:
+        return None
+    return sys.modules["batched_inference"].batching_stats()
+
+
+@app.get("/api/trace")
+async def list_traces():
+    """Sessions with a recorded frame timeline"""
+    if not FRAME_TRACE_ENABLED:
+        raise HTTPException(status_code=404, detail="Frame tracing is disabled (set FRAME_TRACE=1)")
+    return {"sessions": _get_trace_registry().list()}
+
+
+@app.get("/api/trace/{pc_id}")
+async def get_trace(pc_id: str):
+    """Chrome trace-event JSON of one session's frame timeline"""
+    if not FRAME_TRACE_ENABLED:
+        raise HTTPException(status_code=404, detail="Frame tracing is disabled (set FRAME_TRACE=1)")
+    session_trace = _get_trace_registry().get(pc_id)
+    if not session_trace:
+        raise HTTPException(status_code=404, detail="No trace for this session")
+    return session_trace.to_chrome_trace()
+
+
+@app.get("/api/pool")
+async def pool_status():
+    """Warm pipeline pool state and recent per-connection time-to-ready"""
+    return {
+        "pool": pipeline_pool.stats(),
+        "connections": ready_times.recent(),
+    }
 
 
 if __name__ == "__main__":
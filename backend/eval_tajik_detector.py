@@ -0,0 +1,128 @@
+# eval_tajik_detector.py — Precision / recall of the already-Tajik fast path
+#
+#   python eval_tajik_detector.py [--verbose]
+import argparse
+import time
+
+from tajik_detector import detect_tajik
+
+# Held out from the detector's seed text
+TAJIK = [
+    "Ман бояд вохӯрии худро барои фардо ба вақти дигар гузорам.",
+    "Ба ман кӯмак лозим аст, лутфан.",
+    "Метавонед лутфан ба ман роҳи истгоҳро нишон диҳед?",
+    "Ташаккури зиёд.",
+    "Ин олӣ аст!",
+    "Ман барои вохӯрӣ бо доктор Смит омадаам.",
+    "Оё ӯ дар ҷо аст?",
+    "Ман зуд бармегардам.",
+    "Номи шумо чист?",
+    "Ман аз Хуҷанд ҳастам.",
+    "Нархи ин себ чанд аст?",
+    "Бубахшед, истгоҳи автобус куҷост?",
+    "Мо имшаб ба театр меравем.",
+    "Вай муаллими забони тоҷикӣ аст.",
+    "Ин китобро кай хондед?",
+    "Духтур гуфт, ки ман бояд истироҳат кунам.",
+    "Барф борид ва роҳҳо баста шуданд.",
+    "Мехостам як пиёла чой нӯшам.",
+    "Шумо чанд сола ҳастед?",
+    "Хона аз ин ҷо дур нест.",
+    "Бародарам дар Маскав кор мекунад.",
+    "Имрӯз рӯзи якшанбе аст.",
+    "Ман намефаҳмам, лутфан оҳистатар гап занед.",
+    "Саломатии шумо чӣ хел?",
+    "Мо дар бораи ин масъала фардо гап мезанем.",
+    "Хайр, то боздид!",
+    "Рахмат, кори шумо олӣ буд.",
+    "Биёед, якҷоя хӯрок хӯрем.",
+]
+
+NOT_TAJIK = [
+    # Russian
+    "Мне нужно перенести встречу на завтра.",
+    "Во сколько начинается встреча?",
+    "Помогите, пожалуйста.",
+    "Большое спасибо.",
+    "Как вас зовут?",
+    "Я из Худжанда.",
+    "Сколько стоит это яблоко?",
+    "Извините, где автобусная остановка?",
+    "Мы сегодня вечером идём в театр.",
+    "Он учитель таджикского языка.",
+    "Когда вы прочитали эту книгу?",
+    "Врач сказал, что мне нужно отдохнуть.",
+    "Шёл снег, и дороги закрыли.",
+    "Я хотел бы выпить чашку чая.",
+    "Сколько вам лет?",
+    "Дом недалеко отсюда.",
+    "Мой брат работает в Москве.",
+    "Сегодня воскресенье.",
+    "Я не понимаю, говорите медленнее, пожалуйста.",
+    "Как ваше здоровье?",
+    "До свидания!",
+    "Давайте поедим вместе.",
+    "Алло?",
+    "Да.",
+    "Нет, спасибо.",
+    # Russian with Tajik names and places - Tajik letters, but not Tajik
+    "Мой друг Ҷамшед придёт завтра.",
+    "Я живу в Хуҷанде.",
+    "Ҷамшед, как дела?",
+    "Завтра я еду в Кӯлоб.",
+    "Это Ҷӯрабек из Душанбе.",
+    "Позвони Раҳим Ҷонов.",
+    "Передайте привет Шаҳноза и Ҷамшеду.",
+    "Меня зовут Ҷамшед, я из Хуҷанда.",
+    "Ҷумъа встреча отменяется.",
+    # Uzbek / Kazakh / Kyrgyz Cyrillic
+    "Қаерда яшайсиз?",
+    "Мен сени яхши кўраман.",
+    "Рахмат, яхши.",
+    "Сіз қайдан келдіңіз?",
+    "Менің атым Айгүл.",
+    "Кандайсыз?",
+    # Other scripts
+    "I need to reschedule my appointment for tomorrow.",
+    "Necesito ayuda, por favor.",
+    "Könnten Sie mir bitte den Weg zum Bahnhof zeigen?",
+    "这个多少钱？",
+    "شكرا جزيلا",
+    "Salom, qalaysiz?",
+]
+
+
+def main(verbose: bool):
+    tp = fp = fn = tn = 0
+    start = time.perf_counter()
+    for text in TAJIK:
+        result = detect_tajik(text)
+        if result.is_tajik:
+            tp += 1
+        else:
+            fn += 1
+            if verbose:
+                print(f"  missed   {result.score:+.2f} ({result.reason}): {text}")
+    for text in NOT_TAJIK:
+        result = detect_tajik(text)
+        if result.is_tajik:
+            fp += 1
+            if verbose:
+                print(f"  false +  {result.score:+.2f} ({result.reason}): {text}")
+        else:
+            tn += 1
+    elapsed = time.perf_counter() - start
+    total = len(TAJIK) + len(NOT_TAJIK)
+
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    print(f"📊 Tajik detector on {total} sentences")
+    print(f"  precision {precision:.3f}  recall {recall:.3f}")
+    print(f"  tp {tp}  fp {fp}  fn {fn}  tn {tn}")
+    print(f"  {elapsed / total * 1e6:.1f} µs per sentence")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate the already-Tajik classifier")
+    parser.add_argument("--verbose", action="store_true", help="Print misclassified sentences")
+    main(parser.parse_args().verbose)
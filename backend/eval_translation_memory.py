@@ -0,0 +1,88 @@
+# eval_translation_memory.py — Which near-duplicates the translation memory may serve
+#
+#   python eval_translation_memory.py [--verbose]
+#
+# Every query must return the expected stored translation, or miss (None): a cached
+# output with the wrong name, number or a dropped negation is worse than a miss.
+import argparse
+import os
+import tempfile
+
+from translation_memory import TranslationMemory
+
+STORED = {
+    "I will definitely be able to come to the meeting with the director tomorrow morning": "AFFIRMATIVE",
+    "Please transfer 500 dollars to my account today": "500 DOLLARS",
+    "The meeting is at 10 o clock on Monday": "10 O'CLOCK",
+    "My name is Jamshed and I am from Dushanbe": "JAMSHED",
+    "I need to reschedule my appointment for tomorrow": "RESCHEDULE",
+    "Мне нужно перенести встречу на завтра": "ПЕРЕНЕСТИ",
+}
+
+CASES = [
+    # Same meaning - case, punctuation, filler words, typos
+    ("I need to reschedule my appointment for tomorrow.", "RESCHEDULE"),
+    ("Um, I need to reschedule my appointment for tomorrow!", "RESCHEDULE"),
+    ("I need to reschedule my appointment for tomorow", "RESCHEDULE"),
+    ("I need to reschedule my appointments for tomorrow", "RESCHEDULE"),
+    ("My name is Jamshed, and I am from Dushanbe.", "JAMSHED"),
+    ("Ну, мне нужно перенести встречу на завтра.", "ПЕРЕНЕСТИ"),
+    # Dropped or added negation
+    ("I will definitely not be able to come to the meeting with the director tomorrow morning", None),
+    ("I won't be able to come to the meeting with the director tomorrow morning", None),
+    ("Мне не нужно перенести встречу на завтра", None),
+    # Different numbers
+    ("Please transfer 900 dollars to my account today", None),
+    ("Please transfer 5000 dollars to my account today", None),
+    ("The meeting is at 11 o clock on Monday", None),
+    ("The meeting is at ten o clock on Monday", None),
+    # Different names change the translation
+    ("My name is Jamshid and I am from Dushanbe", None),
+    ("My name is Farrukh and I am from Dushanbe", None),
+]
+
+
+def check_reload_keeps_newest() -> bool:
+    """After a restart the latest translation of a normalized key must win"""
+    path = os.path.join(tempfile.mkdtemp(), "memory.db")
+    memory = TranslationMemory(path=path)
+    memory.add("Hello?", "OLD")
+    memory.add("hello", "NEW")
+    memory.close()
+
+    reloaded = TranslationMemory(path=path)
+    reloaded.load()
+    match = reloaded.lookup("hello")
+    reloaded.close()
+    return match is not None and match.target == "NEW"
+
+
+def main(verbose: bool):
+    memory = TranslationMemory(path=None)
+    for source, target in STORED.items():
+        memory.add(source, target)
+
+    failures = 0
+    for query, expected in CASES:
+        match = memory.lookup(query)
+        got = match.target if match else None
+        if got != expected:
+            failures += 1
+            print(f"  ❌ expected {expected}, got {got} ({match.similarity:.3f}): {query}" if match
+                  else f"  ❌ expected {expected}, got a miss: {query}")
+        elif verbose:
+            print(f"  ✅ {got}: {query}")
+
+    reload_ok = check_reload_keeps_newest()
+    if not reload_ok:
+        failures += 1
+        print("  ❌ reload served an older translation")
+
+    print(f"📊 Translation memory: {len(CASES) + 1 - failures}/{len(CASES) + 1} checks passed")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check what the translation memory serves for near-duplicates")
+    parser.add_argument("--verbose", action="store_true", help="Print passing checks too")
+    raise SystemExit(1 if main(parser.parse_args().verbose) else 0)
@@ -0,0 +1,165 @@
+# frame_tracer.py — Opt-in frame timeline tracer for the run_bot pipeline
+#
+# Records when each frame is pushed to, starts processing in, and is pushed out of
+# every processor, in a bounded per-session ring buffer. Dumps Chrome trace-event
+# JSON (open in chrome://tracing or https://ui.perfetto.dev).
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from pipecat.observers.base_observer import BaseObserver
+
+# (timestamp ns, kind, processor, peer processor, frame name, frame id, direction)
+TraceEvent = Tuple[int, str, str, Optional[str], str, int, str]
+
+PUSH = "push"
+PROCESS = "process"
+
+
+class SessionTrace:
+    """Ring buffer of frame events for one connection"""
+
+    def __init__(self, session_id: str, max_events: int = 20000):
+        self.session_id = session_id
+        self.started_at = time.time()
+        self.events: Deque[TraceEvent] = deque(maxlen=max_events)
+        self.untimed = 0  # events dropped because the pipeline clock wasn't running yet
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Build Chrome trace events, one track per processor:
+        - "queued" spans from a frame being pushed to a processor until it is processed
+        - frame-name spans from processing (or arrival) until the processor pushes it on
+        Frames a processor consumes or transforms show up as instant events.
+        """
+        tracks: Dict[str, int] = {}
+        arrived: Dict[Tuple[str, int], int] = {}
+        started: Dict[Tuple[str, int], int] = {}
+        trace: List[Dict[str, Any]] = []
+        origin = self.events[0][0] if self.events else 0
+
+        def track(name: str) -> int:
+            if name not in tracks:
+                tracks[name] = len(tracks) + 1
+            return tracks[name]
+
+        def us(ns: int) -> float:
+            return (ns - origin) / 1000
+
+        for ts, kind, processor, peer, frame_name, frame_id, direction in self.events:
+            if kind == PROCESS:
+                key = (processor, frame_id)
+                started[key] = ts
+                queued_at = arrived.pop(key, None)
+                if queued_at is not None and ts > queued_at:
+                    trace.append({
+                        "name": f"queued {frame_name}", "cat": "queue", "ph": "X",
+                        "ts": us(queued_at), "dur": (ts - queued_at) / 1000,
+                        "pid": 1, "tid": track(processor),
+                    })
+                continue
+
+            # A push leaves `processor` and enters `peer`
+            key = (processor, frame_id)
+            processing_at = started.pop(key, None)
+            arrived_at = arrived.pop(key, None)
+            entered = processing_at if processing_at is not None else arrived_at
+            if entered is not None:
+                trace.append({
+                    "name": frame_name, "cat": "frame", "ph": "X",
+                    "ts": us(entered), "dur": (ts - entered) / 1000,
+                    "pid": 1, "tid": track(processor),
+                    "args": {"direction": direction, "to": peer},
+                })
+            else:
+                # Produced here rather than passed through
+                trace.append({
+                    "name": frame_name, "cat": "frame", "ph": "i", "s": "t",
+                    "ts": us(ts), "pid": 1, "tid": track(processor),
+                    "args": {"direction": direction, "to": peer},
+                })
+            if peer:
+                arrived[(peer, frame_id)] = ts
+                track(peer)
+
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+            for name, tid in tracks.items()
+        ]
+        metadata.append({"name": "process_name", "ph": "M", "pid": 1, "args": {"name": f"session {self.session_id}"}})
+        return {"traceEvents": metadata + trace, "displayTimeUnit": "ms"}
+
+
+class FrameTraceObserver(BaseObserver):
+    """Pipecat observer feeding a SessionTrace - attach only when tracing is enabled"""
+
+    def __init__(self, trace: SessionTrace, include_audio: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self._trace = trace
+        self._include_audio = include_audio
+
+    def _skip(self, frame) -> bool:
+        # Audio frames arrive every few ms and would crowd everything else out of the buffer
+        return not self._include_audio and "Audio" in type(frame).__name__
+
+    def _timestamp(self, data) -> Optional[int]:
+        """
+        Pipeline clock time of the event - observers may be notified late, so
+        it's the only accurate clock. Events from before the clock starts
+        (timestamp 0) are dropped rather than mixed with another time base.
+        """
+        timestamp = getattr(data, "timestamp", None)
+        if not timestamp:
+            self._trace.untimed += 1
+            return None
+        return timestamp
+
+    async def on_push_frame(self, data):
+        if self._skip(data.frame):
+            return
+        timestamp = self._timestamp(data)
+        if timestamp is None:
+            return
+        self._trace.events.append((
+            timestamp, PUSH, data.source.name,
+            data.destination.name if data.destination else None,
+            type(data.frame).__name__, data.frame.id, data.direction.name,
+        ))
+
+    async def on_process_frame(self, data):
+        if self._skip(data.frame):
+            return
+        timestamp = self._timestamp(data)
+        if timestamp is None:
+            return
+        self._trace.events.append((
+            timestamp, PROCESS, data.processor.name, None,
+            type(data.frame).__name__, data.frame.id, data.direction.name,
+        ))
+
+
+class TraceRegistry:
+    """Most recent session traces, keyed by WebRTC connection id"""
+
+    def __init__(self, max_sessions: int = 16, max_events: int = 20000):
+        self._sessions: "OrderedDict[str, SessionTrace]" = OrderedDict()
+        self._max_sessions = max_sessions
+        self._max_events = max_events
+
+    def session(self, session_id: str) -> SessionTrace:
+        trace = self._sessions.get(session_id)
+        if trace is None:
+            trace = SessionTrace(session_id, self._max_events)
+            self._sessions[session_id] = trace
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
+        return trace
+
+    def get(self, session_id: str) -> Optional[SessionTrace]:
+        return self._sessions.get(session_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        return [
+            {"session_id": t.session_id, "started_at": t.started_at, "events": len(t.events), "untimed": t.untimed}
+            for t in self._sessions.values()
+        ]
@@ -2,7 +2,9 @@
 import torch
 import numpy as np
 import asyncio
-from typing import AsyncGenerator
+import re
+import threading
+from typing import AsyncGenerator, Callable, List, Optional
 from transformers import VitsModel, AutoTokenizer
 from pipecat.services.tts_service import TTSService
 from pipecat.frames.frames import AudioRawFrame, TTSStartedFrame, TTSStoppedFrame, ErrorFrame, TTSAudioRawFrame
@@ -11,8 +13,69 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Sentence boundaries for splitting multi-sentence translations into one batch
+_SENTENCE_END = re.compile(r'(?<=[.!?…])\s+')
+
+# Pause put back between separately synthesized sentences
+SENTENCE_GAP_SECS = 0.25
+
+
+def prepare_text(text: str) -> str:
+    """Prepare text for MMS TTS"""
+    text = text.strip()
+    text = text.replace('"', '')
+    text = text.replace("'", '')
+    if not text:
+        text = "."
+    return text
+
+
+def split_sentences(text: str) -> List[str]:
+    """Prepared sentences of a translation, for batched synthesis"""
+    return [prepare_text(s) for s in _SENTENCE_END.split(text.strip()) if s.strip()] or ["."]
+
+
+def join_sentences(waveforms: List[np.ndarray], sample_rate: int = 16000) -> np.ndarray:
+    """Concatenate per-sentence audio with a short pause between sentences"""
+    gap = np.zeros(int(SENTENCE_GAP_SECS * sample_rate), dtype=np.float32)
+    parts = []
+    for i, waveform in enumerate(waveforms):
+        if i:
+            parts.append(gap)
+        parts.append(waveform)
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32)
+
+
+def load_mms_model(model_path: str, device: str):
+    """Load the MMS tokenizer and VITS model from a local path"""
+    logger.info(f"Loading MMS model from local path: {model_path}")
+    
+    # Load tokenizer from local path
+    tokenizer = AutoTokenizer.from_pretrained(
+        model_path,
+        local_files_only=True
+    )
+    
+    # Load model from local path
+    model = VitsModel.from_pretrained(
+        model_path,
+        torch_dtype=torch.float32,  # Use float32 for stability on MPS
+        local_files_only=True
+    )
+    model.eval()
+    model.to(device)
+    return tokenizer, model
+
+
 class MMSTTSTajik(TTSService):
-    def __init__(self, model_path: str, **kwargs):
+    def __init__(
+        self,
+        model_path: str,
+        on_synthesis_cancelled: Optional[Callable[[bool], None]] = None,
+        on_audio_started: Optional[Callable[[], None]] = None,
+        scheduler=None,
+        **kwargs
+    ):
         super().__init__(**kwargs)
         
         # M1 Mac optimized settings
@@ -20,28 +83,24 @@ class MMSTTSTajik(TTSService):
         
         self._model_path = model_path
         self._sample_rate = 16000
+        # Called with skipped=True if an interrupted synthesis never ran, False if it
+        # was already running and finished anyway (the forward pass can't be stopped)
+        self._on_synthesis_cancelled = on_synthesis_cancelled
+        self._on_audio_started = on_audio_started
         
-        self._load_models()
+        # 🧮 Shared cross-session TTSBatchScheduler - it owns the model when set
+        self._scheduler = scheduler
+        
+        # An abandoned synthesis keeps running in its thread - don't overlap it with the next
+        self._synthesis_lock = threading.Lock()
+        
+        if self._scheduler is None:
+            self._load_models()
     
     def _load_models(self):
         """Load models optimized for M1"""
         try:
-            logger.info(f"Loading MMS model from local path: {self._model_path}")
-            
-            # Load tokenizer from local path
-            self.tokenizer = AutoTokenizer.from_pretrained(
-                self._model_path,
-                local_files_only=True
-            )
-            
-            # Load model from local path
-            self.model = VitsModel.from_pretrained(
-                self._model_path,
-                torch_dtype=torch.float32,  # Use float32 for stability on MPS
-                local_files_only=True
-            )
-            self.model.eval()
-            self.model.to(self.device)
+            self.tokenizer, self.model = load_mms_model(self._model_path, self.device)
             
             logger.info("✅ Models loaded successfully")
             
@@ -51,26 +110,33 @@ class MMSTTSTajik(TTSService):
     
     def _prepare_text(self, text: str) -> str:
         """Prepare text for MMS TTS"""
-        text = text.strip()
-        text = text.replace('"', '')
-        text = text.replace("'", '')
-        if not text:
-            text = "."
-        return text
+        return prepare_text(text)
     
-    def _generate_speech(self, text: str) -> np.ndarray:
+    def _generate_speech(self, text: str, cancelled: Optional[threading.Event] = None) -> Optional[np.ndarray]:
         """Generate speech from text using MMS — FIXED MPS DTYPE ISSUE"""
         try:
             text = self._prepare_text(text)
             
+            if self._scheduler:
+                return self._scheduler.synthesize_batch([text])[0]
+            
             # Tokenize text
             inputs = self.tokenizer(text, return_tensors="pt")
             
             # 🔥 CRITICAL FIX: Cast input_ids to long() for MPS compatibility
             inputs = {k: v.long().to(self.device) for k, v in inputs.items()}
             
-            with torch.no_grad():
-                output = self.model(**inputs).waveform
+            with self._synthesis_lock:
+                # Interrupted while waiting behind another synthesis - skip the work
+                if cancelled is not None and cancelled.is_set():
+                    if self._on_synthesis_cancelled:
+                        self._on_synthesis_cancelled(True)
+                    return None
+                with torch.no_grad():
+                    output = self.model(**inputs).waveform
+            
+            if cancelled is not None and cancelled.is_set() and self._on_synthesis_cancelled:
+                self._on_synthesis_cancelled(False)
             
             audio_array = output.squeeze().cpu().numpy()
             audio_array = np.clip(audio_array, -1.0, 1.0)
@@ -81,6 +147,16 @@ class MMSTTSTajik(TTSService):
             logger.error(f"Speech generation error: {e}")
             return np.zeros(self._sample_rate, dtype=np.float32)
     
+    async def _generate_batched(self, text: str) -> list:
+        """Split into sentences and submit them together to the shared scheduler"""
+        try:
+            return await self._scheduler.synthesize_many(split_sentences(text), self._on_synthesis_cancelled)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Speech generation error: {e}")
+            return [np.zeros(self._sample_rate, dtype=np.float32)]
+    
     async def run_tts(self, text: str) -> AsyncGenerator:
         """Run TTS generation — FIXED: Removed 'pts' (not supported in your Pipecat version)"""
         try:
@@ -89,8 +165,17 @@ class MMSTTSTajik(TTSService):
             # Yield start frame
             yield TTSStartedFrame()
             
-            # Generate audio
-            audio_data = self._generate_speech(text)
+            # Generate audio off the event loop so an interruption can abandon it
+            cancelled = threading.Event()
+            try:
+                if self._scheduler:
+                    audio_data = join_sentences(await self._generate_batched(text), self._sample_rate)
+                else:
+                    audio_data = await asyncio.to_thread(self._generate_speech, text, cancelled)
+            except asyncio.CancelledError:
+                logger.info("TTS synthesis cancelled by interruption")
+                cancelled.set()
+                raise
             
             # Convert to frame if we have audio
             if len(audio_data) > 0:
@@ -106,6 +191,10 @@ class MMSTTSTajik(TTSService):
                     num_channels=1
                 )
                 
+                # ✋ This turn's audio is on its way out - it can no longer be barged in on
+                if self._on_audio_started:
+                    self._on_audio_started()
+                
                 yield frame
                 logger.info(f"✅ Generated {len(audio_data)/self._sample_rate:.2f}s of audio")
             else:
@@ -134,6 +134,7 @@ class AmeenaTranslator:
 )
 @modal.asgi_app()
 def fastapi_app():
+    import asyncio
     from fastapi import FastAPI, HTTPException
     from pydantic import BaseModel
     
@@ -176,14 +177,34 @@ Your entire response must consist ONLY of the Tajik translation. Nothing else.""
     
     translator = AmeenaTranslator()
     
+    # 🔁 Identical texts being translated right now share one backend call
+    in_flight: Dict[str, asyncio.Task] = {}
+    request_stats = {"requests": 0, "backend_calls": 0, "deduplicated": 0}
+    
+    async def translate_shared(text: str) -> str:
+        task = in_flight.get(text)
+        if task is None:
+            # Not tied to the first caller - if it disconnects, the others still get a result
+            task = asyncio.create_task(
+                translator.translate.remote.aio(
+                    text=text,
+                    system_prompt=TRANSLATOR_SYSTEM_PROMPT
+                )
+            )
+            task.add_done_callback(lambda _: in_flight.pop(text, None))
+            in_flight[text] = task
+            request_stats["backend_calls"] += 1
+        else:
+            request_stats["deduplicated"] += 1
+        return await asyncio.shield(task)
+    
     @web_app.post("/translate", response_model=TranslationResponse)
     async def translate_endpoint(request: TranslationRequest):
         """Translate text to Tajik"""
+        request_stats["requests"] += 1
         try:
-            translation = translator.translate.remote(
-                text=request.text,
-                system_prompt=TRANSLATOR_SYSTEM_PROMPT
-            )
+            # Async remote call - keeps the event loop free for concurrent inputs
+            translation = await translate_shared(request.text)
             
             return TranslationResponse(
                 translation=translation,
@@ -194,7 +215,12 @@ Your entire response must consist ONLY of the Tajik translation. Nothing else.""
     
     @web_app.get("/health")
     async def health():
-        return {"status": "healthy", "service": "ameena-translator"}
+        return {
+            "status": "healthy",
+            "service": "ameena-translator",
+            "in_flight": len(in_flight),
+            **request_stats,
+        }
     
     return web_app
 
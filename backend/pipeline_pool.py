@@ -0,0 +1,161 @@
+# pipeline_pool.py — Pre-built, warmed pipeline components for fast /api/offer
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from loguru import logger
+
+
+@dataclass
+class WarmComponents:
+    """One set of pipeline services, built and warmed, ready for one connection"""
+    services: Dict[str, Any]
+    build_secs: float
+    warmup_secs: float
+    created_at: float = field(default_factory=time.monotonic)
+    warm: bool = True  # False when built inline because the pool was empty
+
+
+class PipelinePool:
+    """
+    Keeps `size` sets of warmed pipeline components ready.
+
+    Pipecat processors are single-use (they are torn down with their
+    pipeline), so each acquired set is handed out once and the pool
+    refills itself in the background. Failed builds are retried with
+    exponential backoff.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[WarmComponents]],
+        size: int = 1,
+        retry_initial_secs: float = 1.0,
+        retry_max_secs: float = 60.0,
+    ):
+        self._factory = factory
+        self._size = max(0, size)
+        self._retry_initial_secs = retry_initial_secs
+        self._retry_max_secs = retry_max_secs
+        self._ready: Deque[WarmComponents] = deque()
+        self._building = 0
+        self._refill_tasks: set = set()
+        self._available = asyncio.Event()
+        self._closed = False
+
+        # 📊 Stats
+        self.hits = 0
+        self.misses = 0
+        self.build_failures = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def start(self):
+        """Fill the pool in the background - does not block startup"""
+        logger.info(f"🔥 Warming pipeline pool (size={self._size})")
+        self._schedule_refill()
+
+    async def acquire(self) -> WarmComponents:
+        """Take a warmed set, or build one inline if the pool is empty"""
+        if self._ready:
+            components = self._ready.popleft()
+            if not self._ready:
+                self._available.clear()
+            self.hits += 1
+            logger.info(f"♨️ Pool hit - {len(self._ready)} warm set(s) left")
+        else:
+            self.misses += 1
+            logger.warning("🧊 Pool empty - building pipeline components inline")
+            # Counts as a build in progress so a refill doesn't load the models alongside it
+            self._building += 1
+            try:
+                components = await self._factory()
+            finally:
+                self._building -= 1
+            components.warm = False
+
+        self._schedule_refill()
+        return components
+
+    def _schedule_refill(self):
+        if self._closed:
+            return
+        missing = self._size - len(self._ready) - self._building
+        for _ in range(missing):
+            self._building += 1
+            task = asyncio.create_task(self._build_one())
+            self._refill_tasks.add(task)
+            task.add_done_callback(self._refill_tasks.discard)
+
+    async def _build_one(self):
+        delay = self._retry_initial_secs
+        try:
+            while not self._closed:
+                try:
+                    components = await self._factory()
+                except Exception as e:
+                    self.build_failures += 1
+                    self.last_error = str(e)
+                    logger.error(f"Failed to build warm pipeline, retrying in {delay:.1f}s: {e}")
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self._retry_max_secs)
+                    continue
+
+                if self._closed:
+                    return
+                self.last_error = None
+                self._ready.append(components)
+                self._available.set()
+                logger.info(
+                    f"✅ Warm pipeline ready (build {components.build_secs:.2f}s, "
+                    f"warmup {components.warmup_secs:.2f}s, pool {len(self._ready)}/{self._size})"
+                )
+                return
+        finally:
+            self._building -= 1
+
+    async def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait until at least one warm set is available"""
+        if self._size == 0:
+            return True
+        try:
+            await asyncio.wait_for(self._available.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def stop(self):
+        self._closed = True
+        for task in list(self._refill_tasks):
+            task.cancel()
+        await asyncio.gather(*self._refill_tasks, return_exceptions=True)
+        self._ready.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self._size,
+            "ready": len(self._ready),
+            "building": self._building,
+            "hits": self.hits,
+            "misses": self.misses,
+            "build_failures": self.build_failures,
+            "last_error": self.last_error,
+        }
+
+
+class ReadyTimes:
+    """Bounded record of per-connection time-to-ready"""
+
+    def __init__(self, maxlen: int = 100):
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=maxlen)
+
+    def record(self, pc_id: str, seconds: float, warm: bool):
+        self._entries.append({"pc_id": pc_id, "time_to_ready_secs": round(seconds, 3), "warm": warm})
+
+    def recent(self) -> List[Dict[str, Any]]:
+        return list(self._entries)
@@ -0,0 +1,49 @@
+# profile_startup.py — Import-time profile of bot_translator
+#
+#   python profile_startup.py            # lazy: what uvicorn pays before serving /api/translate
+#   python profile_startup.py --eager    # plus every pipeline import (the old module-load cost)
+#   python profile_startup.py --top 30   # show more of the slowest modules
+import argparse
+import os
+import subprocess
+import sys
+
+EAGER_IMPORTS = "import bot_translator; bot_translator._import_heavy_modules()"
+LAZY_IMPORTS = "import bot_translator"
+
+
+def profile(code: str):
+    """Run `code` in a fresh interpreter with -X importtime; return (total µs, [(µs, module)])"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(result.stderr.strip().splitlines()[-1])
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nested imports are indented; top-level ones sum to the total
+        modules.append((int(cumulative_us), name[1:].rstrip()))
+    total = sum(us for us, name in modules if not name.startswith(" "))
+    return total, modules
+
+
+def main(args):
+    for label, code in [("lazy", LAZY_IMPORTS)] + ([("eager", EAGER_IMPORTS)] if args.eager else []):
+        total, modules = profile(code)
+        print(f"📦 {label}: {total / 1e6:.2f}s to import")
+        for us, name in sorted(modules, reverse=True)[:args.top]:
+            print(f"   {us / 1e3:9.1f} ms  {name.strip()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import-time profile of bot_translator")
+    parser.add_argument("--eager", action="store_true", help="Also profile importing the full voice pipeline")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list (default: 15)")
+    main(parser.parse_args())
@@ -0,0 +1,205 @@
+# prompt_builder.py — Script-aware assembly of the translation system prompt, and
+# cleanup of prompt leakage in the model's output
+import math
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, Tuple
+
+from loguru import logger
+
+LATIN = "latin"
+CYRILLIC = "cyrillic"
+HAN = "han"
+ARABIC = "arabic"
+MIXED = "mixed"  # no dominant script - fall back to the full prompt
+
+ALL_SCRIPTS = frozenset({LATIN, CYRILLIC, HAN, ARABIC})
+
+# Upper bound used by both the voice pipeline and /api/translate
+MAX_TOKENS = 150
+
+
+@dataclass(frozen=True)
+class PromptExample:
+    text: str
+    scripts: FrozenSet[str]
+
+
+PROMPT_HEADER = """You are a highly advanced translation engine. Your sole function is to translate text from ANY source language into precise, natural Tajik.
+
+**CORE DIRECTIVE:**
+1. Auto-detect the source language
+2. Translate the input into Tajik
+3. If already in Tajik, return it unchanged
+
+**STRICT PROHIBITIONS:**
+❌ Do not add any text before or after the translation
+❌ Do not add labels like "Translation:", "Тарҷума:", "Here is:"
+❌ Do not explain, apologize, or add context
+❌ Do not answer questions—translate them literally
+❌ Do not include parenthetical notes, alternatives, or footnotes
+❌ Do not output <think> tags or internal reasoning
+❌ Do not add conversational responses like "Ман туро мешунавам..."
+❌ Do not add dialogue attribution like "- Падар (ба писар)"
+❌ Do not alter the meaning, tone, or intent
+❌ Do not correct errors in the source—translate as-is
+
+**MANDATORY ACTIONS:**
+✅ Preserve exact meaning and nuance
+✅ Maintain original tone (formal/informal/slang)
+✅ Output ONLY the clean Tajik translation"""
+
+CORRECT_EXAMPLES: Tuple[PromptExample, ...] = (
+    PromptExample("""**English:**
+Input: "I need to reschedule my appointment for tomorrow."
+Output: Ман бояд вохӯрии худро барои фардо ба вақти дигар гузорам.""", frozenset({LATIN})),
+    PromptExample("""**Russian:**
+Input: "Во сколько начинается встреча?"
+Output: Вохӯрӣ соати чанд сар мешавад?""", frozenset({CYRILLIC})),
+    PromptExample("""**Chinese:**
+Input: "这个多少钱？"
+Output: Ин чанд пул аст?""", frozenset({HAN})),
+    PromptExample("""**Spanish:**
+Input: "Necesito ayuda, por favor."
+Output: Ба ман кӯмак лозим аст, лутфан.""", frozenset({LATIN})),
+    PromptExample("""**German (Formal):**
+Input: "Könnten Sie mir bitte den Weg zum Bahnhof zeigen?"
+Output: Метавонед лутфан ба ман роҳи истгоҳро нишон диҳед?""", frozenset({LATIN})),
+    PromptExample("""**Arabic:**
+Input: "شكرا جزيلا"
+Output: Ташаккури зиёд.""", frozenset({ARABIC})),
+    PromptExample("""**English (Informal Slang):**
+Input: "That's awesome!"
+Output: Ин олӣ аст!""", frozenset({LATIN})),
+    PromptExample("""**Multi-sentence:**
+Input: "Good morning. I'm here to see Dr. Smith. Is he available?"
+Output: Субҳ ба хайр. Ман барои вохӯрӣ бо доктор Смит омадаам. Оё ӯ дар ҷо аст?""", frozenset({LATIN})),
+    PromptExample("""**Already Tajik:**
+Input: "Ин як ҷумлаи тоҷикӣ аст."
+Output: Ин як ҷумлаи тоҷикӣ аст.""", frozenset({CYRILLIC})),
+)
+
+# Failure modes - the generic ones are kept for every script
+INCORRECT_EXAMPLES: Tuple[PromptExample, ...] = (
+    PromptExample("""Input: "Где здесь аптека?"
+Wrong: Тарҷума аз русӣ: Дар ин ҷо дорухона дар куҷост? ❌
+Correct: Дар ин ҷо дорухона дар куҷост?""", frozenset({CYRILLIC})),
+    PromptExample("""Input: "Hello?"
+Wrong: Салом! Ман туро мешунавам, ту ҷастухез намекунӣ. ❌
+Correct: Салом?""", ALL_SCRIPTS),
+    PromptExample("""Input: "He will arrive soon."
+Wrong: Ӯ зуд мерасад (дар тавзеҳот омадааст: дар роҳ аст) ❌
+Correct: Ӯ зуд мерасад.""", frozenset({LATIN})),
+    PromptExample("""Input: "Do you hear me?"
+Wrong: <think>This is a question</think> Оё шумо маро мешунавед? ❌
+Correct: Оё шумо маро мешунавед?""", ALL_SCRIPTS),
+    PromptExample("""Input: "Can I speak with Mr. John?"
+Wrong: Оё ман бо ҷаноби Ҷон гап зада метавонам? - Падар (ба писар) ❌
+Correct: Оё ман бо ҷаноби Ҷон гап зада метавонам?""", frozenset({LATIN})),
+)
+
+PROMPT_FOOTER = """**FINAL INSTRUCTION:**
+Your entire response must consist ONLY of the Tajik translation. Nothing else."""
+
+# Rough output tokens per input character, by source script
+_TOKENS_PER_CHAR = {
+    LATIN: 0.6,
+    CYRILLIC: 0.6,
+    ARABIC: 0.8,
+    HAN: 2.0,  # one Han character expands to several Tajik words
+    MIXED: 1.0,
+}
+
+
+def _assemble(script: str) -> str:
+    def pick(examples):
+        return [e.text for e in examples if script == MIXED or script in e.scripts]
+
+    sections = [PROMPT_HEADER]
+    correct = pick(CORRECT_EXAMPLES)
+    if correct:
+        sections.append("**CORRECT EXAMPLES:**\n\n" + "\n\n".join(correct))
+    incorrect = pick(INCORRECT_EXAMPLES)
+    if incorrect:
+        sections.append("**INCORRECT EXAMPLES (NEVER DO THIS):**\n\n" + "\n\n".join(incorrect))
+    sections.append(PROMPT_FOOTER)
+    return "\n\n---\n\n".join(sections)
+
+
+# Full prompt with every example - used when the script can't be determined
+TRANSLATOR_SYSTEM_PROMPT = _assemble(MIXED)
+
+
+def detect_script(text: str, dominance: float = 0.6) -> str:
+    """Cheap dominant-script detection from Unicode character names"""
+    counts = {LATIN: 0, CYRILLIC: 0, HAN: 0, ARABIC: 0}
+    letters = 0
+    for ch in text:
+        if not ch.isalpha():
+            continue
+        letters += 1
+        if ch.isascii():
+            counts[LATIN] += 1
+            continue
+        name = unicodedata.name(ch, "")
+        if name.startswith("LATIN"):
+            counts[LATIN] += 1
+        elif name.startswith("CYRILLIC"):
+            counts[CYRILLIC] += 1
+        elif name.startswith("CJK"):
+            counts[HAN] += 1
+        elif name.startswith("ARABIC"):
+            counts[ARABIC] += 1
+
+    if not letters:
+        return MIXED
+    script, count = max(counts.items(), key=lambda item: item[1])
+    return script if count / letters >= dominance else MIXED
+
+
+@lru_cache(maxsize=None)
+def system_prompt_for_script(script: str) -> str:
+    return _assemble(script)
+
+
+def build_system_prompt(text: str) -> str:
+    """System prompt with only the examples relevant to the input's script"""
+    return system_prompt_for_script(detect_script(text))
+
+
+def estimate_max_tokens(text: str, floor: int = 24, ceiling: int = MAX_TOKENS) -> int:
+    """Scale the generation budget to the input length"""
+    factor = _TOKENS_PER_CHAR[detect_script(text)]
+    return max(floor, min(ceiling, math.ceil(len(text) * factor) + 16))
+
+
+def clean_translation_output(text: str) -> str:
+    """🧹 AGGRESSIVE CLEANING - Remove ALL non-translation content"""
+    if not text:
+        return ""
+    
+    # Remove thinking tags
+    text = re.sub(r'<think[^>]*>.*?</think>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r'</?think[^>]*>', '', text, flags=re.IGNORECASE)
+    
+    # Remove common prefixes/labels
+    text = re.sub(r'^(Translation:|Output:|Тарҷума:|Text:|Input:|Wrong:|Correct:)\s*', '', text, flags=re.IGNORECASE)
+    
+    # Remove parenthetical explanations
+    text = re.sub(r'\([^)]*тавзеҳот[^)]*\)', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'\([^)]*омадааст[^)]*\)', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'\s*-\s*Падар.*$', '', text, flags=re.IGNORECASE)  # Remove dialogue attribution
+    
+    # Remove extra explanatory phrases
+    text = re.sub(r'Ман туро мешунавам[^.]*\.', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'(буданаш маълум шуд|дар рӯшноӣ)', '', text, flags=re.IGNORECASE)
+    
+    # Clean whitespace and punctuation
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s+([,.!?])', r'\1', text)  # Fix spacing before punctuation
+    text = text.strip()
+    
+    logger.info(f"🧹 Cleaned: '{text}'")
+    return text
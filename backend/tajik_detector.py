@@ -0,0 +1,144 @@
+# tajik_detector.py — Fast local check for input that is already Tajik
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict
+
+# Letters found only in the Tajik Cyrillic alphabet
+TAJIK_STRONG_LETTERS = set("ҷӯӣҶӮӢ")
+# Tajik letters shared with Uzbek Cyrillic
+TAJIK_WEAK_LETTERS = set("қғҳҚҒҲ")
+# Russian letters dropped from the Tajik alphabet (plus Kazakh/Kyrgyz/Uzbek-only ones)
+NON_TAJIK_LETTERS = set("ыщьцЫЩЬЦўЎүҮұҰңҢәӘіІөӨһҺ")
+
+# Frequent Tajik words that are not Russian words
+TAJIK_FUNCTION_WORDS = {
+    "аст", "ман", "шумо", "мо", "ин", "дар", "ба", "барои", "бо", "аз", "ва", "ки",
+    "чанд", "хуб", "бисёр", "хайр", "ҳастам", "ҳастед", "нест", "кунед", "лутфан",
+}
+
+# Seed text for the character trigram models - short, everyday sentences
+_TAJIK_SEED = """
+ман ба мактаб меравам. ту чӣ кор мекунӣ? ин китоб хеле хуб аст.
+мо дар шаҳри душанбе зиндагӣ мекунем. шумо аз куҷо омадед? ӯ ҳоло дар хона нест.
+лутфан ба ман кӯмак кунед. рӯзи хуб дошта бошед. ташаккур барои ҳама чиз.
+вохӯрӣ соати чанд сар мешавад? ин чанд пул аст? ман тоҷикӣ гап мезанам.
+фардо мо ба кӯҳ меравем. падарам дар бозор кор мекунад. модарам хӯрок пухт.
+ҳаво имрӯз гарм аст. ман туро дӯст медорам. бачаҳо дар ҳавлӣ бозӣ мекунанд.
+оё шумо маро мешунавед? мо бояд зудтар равем. вай ба забони англисӣ хуб медонад.
+салом, аҳволатон чӣ тавр? хуш омадед. бисёр хуб. не, ман намедонам. ҳа, албатта.
+дар ин ҷо дорухона дар куҷост? субҳ ба хайр. шаб ба хайр. ин ҷумлаи тоҷикӣ аст.
+китобҳоро ба ман диҳед. мошин дар назди дар истодааст. ман гуруснаам.
+"""
+
+_RUSSIAN_SEED = """
+я иду в школу. что ты делаешь? эта книга очень хорошая.
+мы живём в городе душанбе. откуда вы приехали? его сейчас нет дома.
+пожалуйста, помогите мне. хорошего дня. спасибо за всё.
+во сколько начинается встреча? сколько это стоит? я говорю по-русски.
+завтра мы поедем в горы. мой отец работает на рынке. мама приготовила ужин.
+сегодня жарко. я тебя люблю. дети играют во дворе.
+вы меня слышите? нам нужно идти быстрее. она хорошо знает английский язык.
+привет, как дела? добро пожаловать. очень хорошо. нет, я не знаю. да, конечно.
+где здесь аптека? доброе утро. спокойной ночи. это русское предложение.
+дайте мне книги. машина стоит у двери. я голоден.
+"""
+
+_WORD_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+
+
+def _trigrams(text: str):
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            yield padded[i:i + 3]
+
+
+class _TrigramModel:
+    """Add-one smoothed character trigram log-probabilities"""
+
+    def __init__(self, seed: str):
+        self._counts = Counter(_trigrams(seed))
+        self._total = sum(self._counts.values())
+        self._vocab = len(self._counts) + 1
+
+    def log_prob(self, trigram: str) -> float:
+        return math.log((self._counts.get(trigram, 0) + 1) / (self._total + self._vocab))
+
+
+_TAJIK_MODEL = _TrigramModel(_TAJIK_SEED)
+_RUSSIAN_MODEL = _TrigramModel(_RUSSIAN_SEED)
+
+
+def _log_likelihood_ratio(words) -> float:
+    """Mean per-trigram log P(Tajik) - log P(Russian)"""
+    grams = [g for word in words for g in _trigrams(word)]
+    return sum(_TAJIK_MODEL.log_prob(g) - _RUSSIAN_MODEL.log_prob(g) for g in grams) / max(1, len(grams))
+
+
+@dataclass
+class TajikDetection:
+    is_tajik: bool
+    score: float
+    reason: str
+
+
+def detect_tajik(text: str, threshold: float = 1.0, min_letters: int = 3) -> TajikDetection:
+    """
+    Decide whether `text` is already Tajik.
+
+    Tuned for precision: a false positive speaks untranslated text back,
+    so anything ambiguous goes to the LLM instead.
+    """
+    letters = [ch for ch in text if ch.isalpha()]
+    if len(letters) < min_letters:
+        return TajikDetection(False, 0.0, "too short")
+
+    cyrillic = sum(1 for ch in letters if "Ѐ" <= ch <= "ӿ")
+    if cyrillic / len(letters) < 0.8:
+        return TajikDetection(False, 0.0, "not cyrillic")
+
+    if any(ch in NON_TAJIK_LETTERS for ch in letters):
+        return TajikDetection(False, -1.0, "non-tajik letters")
+
+    words = _WORD_RE.findall(text.lower())
+    strong_words = {w for w in words if TAJIK_STRONG_LETTERS.intersection(w)}
+    other_words = [w for w in words if w not in strong_words]
+    llr = _log_likelihood_ratio(words)
+
+    weak = sum(1 for ch in letters if ch in TAJIK_WEAK_LETTERS)
+    function_words = sum(1 for w in words if w in TAJIK_FUNCTION_WORDS)
+    score = llr + 1.5 * min(len(strong_words), 2) + 0.5 * min(weak, 2) + 0.5 * min(function_words, 2)
+
+    if strong_words:
+        # A Tajik-lettered name ("Ҷамшед", "Хуҷанд") in a Russian sentence is
+        # not Tajik - the rest of the sentence must agree
+        if function_words or (other_words and _log_likelihood_ratio(other_words) >= -0.05):
+            return TajikDetection(True, score, "tajik letters")
+        if not other_words and len(strong_words) >= 2:
+            return TajikDetection(True, score, "tajik letters")
+        return TajikDetection(False, score, "tajik letters in names only")
+    if score >= threshold:
+        return TajikDetection(True, score, "trigram model")
+    return TajikDetection(False, score, "below threshold")
+
+
+def is_tajik(text: str) -> bool:
+    return detect_tajik(text).is_tajik
+
+
+class TajikBypassStats:
+    """Counts how often the already-Tajik fast path skipped the LLM"""
+
+    def __init__(self):
+        self.checked: Dict[str, int] = {}
+        self.bypassed: Dict[str, int] = {}
+
+    def record(self, path: str, bypassed: bool):
+        self.checked[path] = self.checked.get(path, 0) + 1
+        if bypassed:
+            self.bypassed[path] = self.bypassed.get(path, 0) + 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {"checked": dict(self.checked), "bypassed": dict(self.bypassed)}
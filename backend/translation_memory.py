@@ -0,0 +1,376 @@
+# translation_memory.py — Fuzzy translation memory (MinHash + LSH, persisted in SQLite)
+import queue
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from loguru import logger
+
+# Words that carry no meaning for translation - dropped before matching
+FILLER_WORDS = {
+    "um", "uh", "uhm", "umm", "er", "erm", "hmm", "mm", "ah", "eh", "oh",
+    "ну", "ээ", "эм", "э", "мм", "ах", "ой",
+}
+
+# Words whose difference flips the meaning - a fuzzy match must agree on them.
+# "n't" normalizes to a separate "t".
+NEGATION_WORDS = {
+    "not", "no", "never", "t", "nor", "neither", "none", "nobody", "nothing", "nowhere", "cannot",
+    "не", "нет", "ни", "никогда", "никто", "ничего", "нигде", "никуда", "нельзя",
+}
+NUMBER_WORDS = {
+    "zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
+    "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen",
+    "nineteen", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety",
+    "hundred", "thousand", "million", "first", "second", "third", "half",
+    "ноль", "один", "одна", "два", "две", "три", "четыре", "пять", "шесть", "семь", "восемь",
+    "девять", "десять", "одиннадцать", "двенадцать", "двадцать", "тридцать", "сорок",
+    "пятьдесят", "сто", "двести", "триста", "пятьсот", "тысяча", "тысячи", "тысяч",
+    "миллион", "первый", "второй", "третий", "половина",
+}
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]", re.UNICODE)
+_DIGITS_RE = re.compile(r"\d")
+_SENTENCE_RE = re.compile(r"[.!?…]+")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Mersenne prime for the universal hash family used by MinHash
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+# Odd 64-bit constant for combining a band's rows into one key
+_BAND_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, strip punctuation and filler words, collapse whitespace"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _PUNCTUATION_RE.sub(" ", text)
+    words = [w for w in text.split() if w not in FILLER_WORDS]
+    return _WHITESPACE_RE.sub(" ", " ".join(words)).strip()
+
+
+def critical_words(normalized: str) -> List[str]:
+    """Numbers and negations of normalized text - inputs differing in these never share a translation"""
+    return sorted(
+        w for w in normalized.split()
+        if w in NEGATION_WORDS or w in NUMBER_WORDS or _DIGITS_RE.search(w)
+    )
+
+
+def name_words(text: str) -> Set[str]:
+    """Lowercased capitalized words not starting a sentence - likely names and places"""
+    names = set()
+    for sentence in _SENTENCE_RE.split(unicodedata.normalize("NFKC", text)):
+        for word in _WORD_RE.findall(sentence)[1:]:
+            if word[0].isupper():
+                names.add(word.lower())
+    return names
+
+
+def char_ngrams(text: str, n: int = 3) -> Set[str]:
+    """Character n-grams of normalized text (padded so short inputs still shingle)"""
+    padded = f" {text} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class MemoryMatch:
+    source: str
+    target: str
+    similarity: float
+
+
+class TranslationMemory:
+    """
+    Stores past source → Tajik translations and returns a stored translation
+    for near-identical inputs.
+
+    Lookups go exact-normalized-match first, then MinHash LSH candidates
+    verified with exact n-gram Jaccard similarity. A fuzzy candidate must also
+    have the same numbers and negations as the input, and contain its names. Entries and their MinHash
+    signatures are persisted in SQLite by a writer thread; call load() (off
+    the event loop) to re-index them.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = "translation_memory.db",
+        threshold: float = 0.85,
+        num_perm: int = 32,
+        bands: int = 8,
+        ngram: int = 3,
+        max_candidates: int = 32,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self._num_perm = num_perm
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._ngram = ngram
+        self._max_candidates = max_candidates
+
+        rng = np.random.RandomState(1)
+        self._perm_a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._perm_b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+
+        self._lock = threading.Lock()
+        self._normalized: List[str] = []
+        self._targets: List[str] = []
+        self._exact: Dict[str, int] = {}
+        self._buckets: List[Dict[int, object]] = [{} for _ in range(bands)]
+
+        # 📊 Stats
+        self.exact_hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+
+        self.loaded = False
+
+        self._path = path
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._writes: "queue.Queue[Optional[Tuple[str, str, float, str, bytes]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        if path:
+            self._open(path)
+        else:
+            self.loaded = True
+
+    # ---------------------------------------------------------------- storage
+
+    def _open(self, path: str):
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "source TEXT PRIMARY KEY, target TEXT NOT NULL, created REAL NOT NULL, "
+            "normalized TEXT, signature BLOB)"
+        )
+        # Databases from before signatures were persisted
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(entries)")}
+        for column, kind in (("normalized", "TEXT"), ("signature", "BLOB")):
+            if column not in columns:
+                self._db.execute(f"ALTER TABLE entries ADD COLUMN {column} {kind}")
+        self._db.commit()
+
+        self._writer = threading.Thread(target=self._write_loop, name="translation-memory-writer", daemon=True)
+        self._writer.start()
+
+    def load(self, chunk_size: int = 5000):
+        """
+        Index every persisted entry (blocking - run in a thread). Lookups and
+        adds keep working meanwhile; they just don't see entries not yet loaded.
+        """
+        if self._db is None or self.loaded:
+            return
+        start = time.perf_counter()
+        with self._db_lock:
+            # Newest first: with replace=False below, the latest translation of a
+            # normalized key wins, as it does in-process
+            rows = self._db.execute(
+                "SELECT source, target, normalized, signature FROM entries ORDER BY created DESC"
+            ).fetchall()
+
+        entries = []
+        signatures = []
+        backfill = []
+        for source, target, normalized, blob in rows:
+            if normalized is None or blob is None or len(blob) != self._num_perm * 8:
+                # Written by an older version (or with a different num_perm)
+                normalized = normalize_text(source)
+                if not normalized:
+                    continue
+                blob = self._signature(char_ngrams(normalized, self._ngram)).tobytes()
+                backfill.append((normalized, blob, source))
+            entries.append((normalized, target))
+            signatures.append(blob)
+
+        if signatures:
+            matrix = np.frombuffer(b"".join(signatures), dtype=np.uint64).reshape(-1, self._num_perm)
+            band_keys = self._band_keys(matrix).tolist()
+            for offset in range(0, len(entries), chunk_size):
+                # Short lock holds so add() from the event loop never waits long
+                with self._lock:
+                    for (normalized, target), keys in zip(
+                        entries[offset:offset + chunk_size], band_keys[offset:offset + chunk_size]
+                    ):
+                        # Entries added since startup are newer than any stored one
+                        self._insert(normalized, target, keys, replace=False)
+
+        if backfill:
+            with self._db_lock:
+                self._db.executemany("UPDATE entries SET normalized = ?, signature = ? WHERE source = ?", backfill)
+                self._db.commit()
+
+        self.loaded = True
+        logger.info(
+            f"📚 Translation memory loaded {len(entries)} entries in {time.perf_counter() - start:.2f}s "
+            f"from {self._path} ({len(backfill)} signatures computed)"
+        )
+
+    def _write_loop(self):
+        """Batch pending inserts into one commit, off the caller's thread"""
+        while True:
+            batch = [self._writes.get()]
+            while True:
+                try:
+                    batch.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+            rows = [row for row in batch if row is not None]
+            if rows:
+                try:
+                    with self._db_lock:
+                        self._db.executemany(
+                            "INSERT OR REPLACE INTO entries (source, target, created, normalized, signature) "
+                            "VALUES (?, ?, ?, ?, ?)",
+                            rows,
+                        )
+                        self._db.commit()
+                except sqlite3.Error as e:
+                    logger.error(f"Translation memory write failed: {e}")
+            if None in batch:
+                return
+
+    def close(self):
+        if self._writer is not None:
+            # Flush pending writes before closing
+            self._writes.put(None)
+            self._writer.join()
+            self._writer = None
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    # ---------------------------------------------------------------- hashing
+
+    def _signature(self, shingles: Set[str]) -> np.ndarray:
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        permuted = (np.outer(self._perm_a, hashes) + self._perm_b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """(n, num_perm) signatures → (n, bands) keys; deterministic, so they vectorize at load"""
+        rows = signatures.reshape(len(signatures), self._bands, self._rows)
+        keys = np.zeros(rows.shape[:2], dtype=np.uint64)
+        for r in range(self._rows):
+            keys = keys * _BAND_MULTIPLIER + rows[:, :, r]
+        return keys
+
+    # ---------------------------------------------------------------- index
+
+    def _insert(self, normalized: str, target: str, band_keys: List[int], replace: bool = True) -> bool:
+        """Index an entry; returns False if it was already indexed"""
+        existing = self._exact.get(normalized)
+        if existing is not None:
+            if replace:
+                self._targets[existing] = target
+            return False
+
+        entry_id = len(self._targets)
+        self._normalized.append(normalized)
+        self._targets.append(target)
+        self._exact[normalized] = entry_id
+
+        for band, key in zip(self._buckets, band_keys):
+            # Most buckets hold a single entry - store a bare int to save memory
+            current = band.get(key)
+            if current is None:
+                band[key] = entry_id
+            elif isinstance(current, list):
+                current.append(entry_id)
+            else:
+                band[key] = [current, entry_id]
+        return True
+
+    def add(self, source: str, target: str):
+        """Remember a translation (indexed now, persisted by the writer thread)"""
+        source = source.strip()
+        target = target.strip()
+        normalized = normalize_text(source)
+        if not normalized or not target:
+            return
+        signature = self._signature(char_ngrams(normalized, self._ngram))
+        with self._lock:
+            self._insert(normalized, target, self._band_keys(signature[None, :])[0].tolist())
+        if self._db is not None:
+            self._writes.put((source, target, time.time(), normalized, signature.tobytes()))
+
+    def lookup(self, source: str) -> Optional[MemoryMatch]:
+        """Return a stored translation whose source is similar enough, if any"""
+        normalized = normalize_text(source)
+        if not normalized:
+            return None
+
+        entry_id = self._exact.get(normalized)
+        if entry_id is not None:
+            self.exact_hits += 1
+            return MemoryMatch(self._normalized[entry_id], self._targets[entry_id], 1.0)
+
+        shingles = char_ngrams(normalized, self._ngram)
+        signature = self._signature(shingles)
+
+        # Rank candidates by how many bands they collide in
+        votes: Dict[int, int] = {}
+        for band, key in zip(self._buckets, self._band_keys(signature[None, :])[0].tolist()):
+            bucket = band.get(key)
+            if bucket is None:
+                continue
+            for candidate in (bucket if isinstance(bucket, list) else (bucket,)):
+                votes[candidate] = votes.get(candidate, 0) + 1
+
+        best_id, best_score = None, 0.0
+        critical = critical_words(normalized)
+        names = name_words(source)
+        ranked = sorted(votes, key=votes.get, reverse=True)[:self._max_candidates]
+        for candidate in ranked:
+            candidate_text = self._normalized[candidate]
+            if critical_words(candidate_text) != critical or not names.issubset(candidate_text.split()):
+                # "500 dollars" vs "5000 dollars", "will" vs "will not", "Jamshed" vs "Jamshid" -
+                # similar text, different translation
+                continue
+            score = jaccard(shingles, char_ngrams(self._normalized[candidate], self._ngram))
+            if score > best_score:
+                best_id, best_score = candidate, score
+
+        if best_id is not None and best_score >= self.threshold:
+            self.fuzzy_hits += 1
+            return MemoryMatch(self._normalized[best_id], self._targets[best_id], best_score)
+
+        self.misses += 1
+        return None
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "entries": len(self._targets),
+            "loaded": self.loaded,
+            "threshold": self.threshold,
+            "exact_hits": self.exact_hits,
+            "fuzzy_hits": self.fuzzy_hits,
+            "misses": self.misses,
+        }
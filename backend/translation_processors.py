@@ -0,0 +1,329 @@
+# translation_processors.py — Pipecat processors around the translation LLM
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+from pipecat.frames.frames import (
+    Frame, 
+    DataFrame,
+    TranscriptionFrame, 
+    LLMContextFrame, 
+    TextFrame,
+    LLMFullResponseStartFrame,
+    LLMFullResponseEndFrame,
+    LLMUpdateSettingsFrame,
+    MetricsFrame,
+    TTSSpeakFrame,
+    StartInterruptionFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame
+)
+from pipecat.metrics.metrics import LLMUsageMetricsData
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
+from pipecat.services.openai.llm import OpenAILLMService
+
+from prompt_builder import MAX_TOKENS, build_system_prompt, clean_translation_output, estimate_max_tokens
+from tajik_detector import TajikBypassStats, detect_tajik
+from translation_memory import TranslationMemory
+from turn_tracker import STAGE_LLM, STAGE_TTS, TurnTracker
+
+
+@dataclass
+class TranslationSourceFrame(DataFrame):
+    """Carries the source text of a turn past the LLM to the aggregator"""
+    text: str
+    turn_id: Optional[int] = None
+    max_tokens: Optional[int] = None
+
+
+class TranslationAggregator(FrameProcessor):
+    """
+    Aggregates all text frames from LLM response into one complete translation,
+    then sends it as a single frame to TTS.
+    
+    A response that used its whole max_tokens budget (per the LLM usage
+    metrics) is treated as cut off: it is never cached, and is handed to
+    `on_truncated` to be retried with the full budget.
+    """
+    
+    def __init__(
+        self,
+        translation_memory: Optional[TranslationMemory] = None,
+        turn_tracker: Optional[TurnTracker] = None,
+        on_truncated: Optional[Callable[[str, Optional[int]], Awaitable[None]]] = None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.current_text = ""
+        self.collecting = False
+        self.translation_memory = translation_memory
+        self.turn_tracker = turn_tracker
+        self.on_truncated = on_truncated
+        self.source_text = None
+        self.turn_id = None
+        self.max_tokens = None
+        self.completion_tokens = None
+        
+    def _reset(self):
+        self.current_text = ""
+        self.source_text = None
+        self.turn_id = None
+        self.max_tokens = None
+        self.completion_tokens = None
+        
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        
+        if isinstance(frame, TranslationSourceFrame):
+            # Remember what is being translated so the result can be stored
+            self.source_text = frame.text
+            self.turn_id = frame.turn_id
+            self.max_tokens = frame.max_tokens
+            self.completion_tokens = None
+            
+        elif isinstance(frame, MetricsFrame):
+            for data in frame.data:
+                if isinstance(data, LLMUsageMetricsData):
+                    self.completion_tokens = data.value.completion_tokens
+            await self.push_frame(frame, direction)
+            
+        elif isinstance(frame, StartInterruptionFrame):
+            # ✋ Barge-in - the partial translation belongs to a superseded turn
+            if self.turn_tracker and self.current_text:
+                self.turn_tracker.dropped_llm_output(len(self.current_text))
+                logger.info(f"🗑️ Dropped partial translation ({len(self.current_text)} chars)")
+            self._reset()
+            self.collecting = False
+            await self.push_frame(frame, direction)
+            
+        elif isinstance(frame, LLMFullResponseStartFrame):
+            # Start collecting text
+            self.current_text = ""
+            self.collecting = True
+            logger.info("📄 Started collecting LLM response...")
+            
+        elif isinstance(frame, TextFrame) and self.collecting:
+            # Accumulate text from LLM
+            self.current_text += frame.text
+            logger.info(f"📝 Accumulated: '{frame.text}' (total: {len(self.current_text)} chars)")
+            # Don't pass individual frames to TTS yet
+            
+        elif isinstance(frame, LLMFullResponseEndFrame):
+            # LLM finished - clean and send complete translation
+            self.collecting = False
+            truncated = (
+                self.max_tokens is not None
+                and self.completion_tokens is not None
+                and self.completion_tokens >= self.max_tokens
+            )
+            
+            if truncated and self.max_tokens < MAX_TOKENS and self.on_truncated and self.source_text:
+                # ✂️ Cut off by the scaled budget - translate again with the full one
+                logger.warning(f"✂️ Translation hit max_tokens={self.max_tokens}, retrying with {MAX_TOKENS}")
+                source_text, turn_id = self.source_text, self.turn_id
+                self._reset()
+                await self.on_truncated(source_text, turn_id)
+                return
+            
+            if self.current_text.strip():
+                cleaned_text = clean_translation_output(self.current_text)
+                
+                if cleaned_text:
+                    logger.info(f"✅ Complete translation: '{cleaned_text}'")
+                    
+                    if self.translation_memory and self.source_text and not truncated:
+                        self.translation_memory.add(self.source_text, cleaned_text)
+                    
+                    if self.turn_tracker and self.turn_tracker.is_cancelled(self.turn_id):
+                        # Superseded while generating - don't synthesize it
+                        logger.info("⏭️ Skipping TTS for cancelled turn")
+                    else:
+                        if self.turn_tracker:
+                            self.turn_tracker.advance(self.turn_id, STAGE_TTS)
+                        
+                        # Send complete translation as TTSSpeakFrame
+                        await self.push_frame(TTSSpeakFrame(text=cleaned_text), direction)
+                else:
+                    logger.warning("⚠️ Empty translation after cleaning")
+            else:
+                logger.warning("⚠️ No text collected from LLM")
+                
+            # Reset for next translation
+            self._reset()
+            
+        elif not isinstance(frame, TextFrame):
+            # Pass through all non-text frames normally
+            await self.push_frame(frame, direction)
+
+
+class StatelessTranslationProcessor(FrameProcessor):
+    """
+    🧠 MEMORY-ENABLED: Accumulates user speech before translating.
+    Waits for user to stop speaking, then translates complete text.
+    """
+    
+    def __init__(
+        self,
+        llm_service: OpenAILLMService,
+        translation_memory: Optional[TranslationMemory] = None,
+        turn_tracker: Optional[TurnTracker] = None,
+        tajik_bypass_stats: Optional[TajikBypassStats] = None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.llm = llm_service
+        self.translation_memory = translation_memory
+        self.turn_tracker = turn_tracker
+        self.tajik_bypass_stats = tajik_bypass_stats
+        
+        # 🧠 MEMORY: Accumulate user's speech
+        self.speech_buffer = []
+        self.last_transcription_time = None
+        self.translation_task = None
+        self.pause_threshold = 1.5  # Wait 1.5 seconds of silence before translating
+        
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        
+        if isinstance(frame, TranscriptionFrame):
+            user_text = frame.text.strip()
+            if not user_text:
+                return
+            
+            # ✋ Still talking - anything not yet spoken back is superseded
+            await self._barge_in()
+            
+            # 📝 Add to speech buffer
+            self.speech_buffer.append(user_text)
+            self.last_transcription_time = asyncio.get_event_loop().time()
+            
+            logger.info(f"📝 Buffered: '{user_text}' (total segments: {len(self.speech_buffer)})")
+            
+            # Cancel previous translation task if still waiting
+            if self.translation_task and not self.translation_task.done():
+                self.translation_task.cancel()
+            
+            # Schedule translation after pause
+            self.translation_task = asyncio.create_task(
+                self._wait_and_translate(direction)
+            )
+            
+        elif isinstance(frame, UserStartedSpeakingFrame):
+            await self.push_frame(frame, direction)
+            
+            # Don't translate half a sentence while the user is still talking
+            if self.translation_task and not self.translation_task.done():
+                self.translation_task.cancel()
+            await self._barge_in()
+            
+        elif isinstance(frame, UserStoppedSpeakingFrame):
+            await self.push_frame(frame, direction)
+            
+            # Re-schedule buffered speech if no transcription arrives to do it
+            if self.speech_buffer and (not self.translation_task or self.translation_task.done()):
+                self.last_transcription_time = asyncio.get_event_loop().time()
+                self.translation_task = asyncio.create_task(
+                    self._wait_and_translate(FrameDirection.DOWNSTREAM)
+                )
+            
+        else:
+            # Pass through all other frames
+            await self.push_frame(frame, direction)
+    
+    async def _barge_in(self):
+        """Cancel the in-flight translation and fold its text back into the buffer"""
+        if not self.turn_tracker or not self.turn_tracker.in_flight:
+            return
+        
+        source_text = self.turn_tracker.cancel()
+        logger.info(f"✋ Barge-in: cancelling in-flight translation of '{source_text}'")
+        
+        # Re-translate it together with the new speech
+        self.speech_buffer.insert(0, source_text)
+        
+        # Interruption stops LLM generation, clears queued TTS and resets the aggregator
+        await self.push_frame(StartInterruptionFrame(), FrameDirection.DOWNSTREAM)
+    
+    async def _wait_and_translate(self, direction: FrameDirection):
+        """Wait for pause, then translate accumulated speech"""
+        try:
+            await asyncio.sleep(self.pause_threshold)
+            
+            # Check if we still have the latest transcription
+            current_time = asyncio.get_event_loop().time()
+            if current_time - self.last_transcription_time >= self.pause_threshold:
+                await self._translate_buffer(direction)
+                
+        except asyncio.CancelledError:
+            # New speech arrived, this task is cancelled
+            pass
+    
+    async def _translate_buffer(self, direction: FrameDirection):
+        """Translate all accumulated speech as one text"""
+        if not self.speech_buffer:
+            return
+        
+        # 🎯 Combine all speech segments with spaces
+        complete_text = " ".join(self.speech_buffer).strip()
+        
+        logger.info(f"🎯 TRANSLATING COMPLETE SPEECH: '{complete_text}'")
+        logger.info(f"📊 Total segments combined: {len(self.speech_buffer)}")
+        
+        # Clear buffer
+        self.speech_buffer = []
+        
+        # 🇹🇯 Already Tajik - speak it as-is, no LLM round trip
+        detection = detect_tajik(complete_text)
+        if self.tajik_bypass_stats:
+            self.tajik_bypass_stats.record("voice", detection.is_tajik)
+        if detection.is_tajik:
+            logger.info(f"🇹🇯 Already Tajik ({detection.reason}) - skipping LLM")
+            if self.turn_tracker:
+                self.turn_tracker.start(complete_text, stage=STAGE_TTS)
+            await self.push_frame(TTSSpeakFrame(text=complete_text), direction)
+            return
+        
+        # 📚 Near-identical speech was translated before - skip the LLM
+        if self.translation_memory:
+            match = self.translation_memory.lookup(complete_text)
+            if match:
+                logger.info(f"📚 Translation memory hit ({match.similarity:.2f}): '{match.target}'")
+                if self.turn_tracker:
+                    self.turn_tracker.start(complete_text, stage=STAGE_TTS)
+                await self.push_frame(TTSSpeakFrame(text=match.target), direction)
+                return
+        
+        turn_id = self.turn_tracker.start(complete_text, stage=STAGE_LLM) if self.turn_tracker else None
+        # ✂️ Only the examples for this script, and a budget scaled to the input
+        await self._request_translation(complete_text, turn_id, estimate_max_tokens(complete_text), direction)
+    
+    async def retranslate(self, source_text: str, turn_id: Optional[int]):
+        """Translate again with the full MAX_TOKENS budget after a cut-off response"""
+        if self.turn_tracker and self.turn_tracker.is_cancelled(turn_id):
+            return
+        await self._request_translation(source_text, turn_id, MAX_TOKENS, FrameDirection.DOWNSTREAM)
+    
+    async def _request_translation(
+        self,
+        text: str,
+        turn_id: Optional[int],
+        max_tokens: int,
+        direction: FrameDirection
+    ):
+        # Let the aggregator know which text the next LLM response belongs to
+        await self.push_frame(
+            TranslationSourceFrame(text=text, turn_id=turn_id, max_tokens=max_tokens),
+            direction
+        )
+        await self.push_frame(LLMUpdateSettingsFrame(settings={"max_tokens": max_tokens}), direction)
+        
+        # Create fresh context with complete text
+        fresh_context = OpenAILLMContext([
+            {"role": "system", "content": build_system_prompt(text)},
+            {"role": "user", "content": text}
+        ])
+        
+        # Send to LLM
+        await self.push_frame(LLMContextFrame(context=fresh_context), direction)
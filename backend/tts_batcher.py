@@ -0,0 +1,146 @@
+# tts_batcher.py — Cross-session batching scheduler for the MMS (VITS) Tajik TTS model
+#
+# Sentences from every session are queued; the scheduler collects up to max_batch of
+# them within max_wait_ms, runs one padded VITS forward pass, and cuts each caller's
+# waveform back out using the model's per-sequence output lengths.
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+
+class TTSBatchScheduler:
+    """One shared VITS model serving batched synthesis for all sessions"""
+
+    def __init__(
+        self,
+        tokenizer,
+        model,
+        device: str,
+        max_batch: int = 8,
+        max_wait_ms: float = 20.0,
+    ):
+        self._tokenizer = tokenizer
+        self._model = model
+        self._device = device
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Direct synthesize_batch calls (warmup, benchmarks) must not overlap the worker's
+        self._model_lock = threading.Lock()
+
+        # 📊 Stats
+        self.batches = 0
+        self.sentences = 0
+        self.skipped = 0  # callers gone (barge-in) before their batch ran
+        self.audio_secs = 0.0
+        self.busy_secs = 0.0
+
+    def synthesize_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Blocking padded forward pass; returns one float32 waveform per text"""
+        import torch
+
+        inputs = self._tokenizer(texts, return_tensors="pt", padding=True)
+        # 🔥 input_ids must be long() on MPS
+        inputs = {k: v.long().to(self._device) for k, v in inputs.items()}
+
+        with self._model_lock, torch.no_grad():
+            output = self._model(**inputs)
+
+        waveforms = output.waveform.cpu().numpy()
+        lengths = output.sequence_lengths.cpu().numpy()
+        return [
+            np.clip(waveforms[i, :int(lengths[i])], -1.0, 1.0).astype(np.float32)
+            for i in range(len(texts))
+        ]
+
+    async def synthesize(self, text: str, on_cancelled: Optional[Callable[[bool], None]] = None) -> np.ndarray:
+        """
+        Queue one sentence for the next batch and wait for its waveform.
+        If the caller is cancelled, `on_cancelled(skipped)` reports whether the
+        sentence was dropped before its batch ran.
+        """
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future, on_cancelled))
+        return await future
+
+    async def synthesize_many(
+        self,
+        texts: List[str],
+        on_cancelled: Optional[Callable[[bool], None]] = None,
+    ) -> List[np.ndarray]:
+        """Queue several sentences at once so they can share a batch"""
+        return list(await asyncio.gather(*(self.synthesize(t, on_cancelled) for t in texts)))
+
+    async def _collect(self) -> List[Tuple[str, asyncio.Future, Optional[Callable[[bool], None]]]]:
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self._max_wait
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            pending = []
+            for text, future, on_cancelled in batch:
+                if not future.done():
+                    pending.append((text, future, on_cancelled))
+                    continue
+                self.skipped += 1
+                if on_cancelled:
+                    on_cancelled(True)
+            if not pending:
+                continue
+
+            start = time.perf_counter()
+            try:
+                waveforms = await asyncio.to_thread(self.synthesize_batch, [text for text, _, _ in pending])
+            except Exception as e:
+                logger.error(f"TTS batch of {len(pending)} failed: {e}")
+                for _, future, _ in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            finally:
+                self.busy_secs += time.perf_counter() - start
+
+            self.batches += 1
+            self.sentences += len(pending)
+            for (_, future, on_cancelled), waveform in zip(pending, waveforms):
+                self.audio_secs += len(waveform) / self._model.config.sampling_rate
+                if not future.done():
+                    future.set_result(waveform)
+                elif on_cancelled:
+                    # Cancelled mid-batch - synthesized anyway
+                    on_cancelled(False)
+
+    async def stop(self):
+        if self._worker:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "sentences": self.sentences,
+            "skipped": self.skipped,
+            "mean_batch_size": round(self.sentences / self.batches, 2) if self.batches else 0.0,
+            "audio_secs": round(self.audio_secs, 2),
+            "busy_secs": round(self.busy_secs, 3),
+        }
@@ -0,0 +1,107 @@
+# turn_tracker.py — In-flight translation turns and barge-in cancellation
+import itertools
+from typing import Dict, Optional, Set
+
+# Stages an in-flight turn moves through before the bot starts speaking it
+STAGE_LLM = "llm"  # context sent, LLM generating
+STAGE_TTS = "tts"  # translation handed to TTS, synthesizing
+
+
+class BargeInStats:
+    """Process-wide counters of work reclaimed by barge-in cancellation"""
+
+    def __init__(self):
+        self.turns_cancelled = 0
+        self.llm_requests_cancelled = 0
+        self.llm_chars_dropped = 0
+        self.tts_requests_skipped = 0
+        self.tts_syntheses_skipped = 0    # interrupted before the model ran - work reclaimed
+        self.tts_syntheses_abandoned = 0  # interrupted mid forward pass - ran to completion anyway
+
+    def tts_synthesis_cancelled(self, skipped: bool):
+        if skipped:
+            self.tts_syntheses_skipped += 1
+        else:
+            self.tts_syntheses_abandoned += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "turns_cancelled": self.turns_cancelled,
+            "llm_requests_cancelled": self.llm_requests_cancelled,
+            "llm_chars_dropped": self.llm_chars_dropped,
+            "tts_requests_skipped": self.tts_requests_skipped,
+            "tts_syntheses_skipped": self.tts_syntheses_skipped,
+            "tts_syntheses_abandoned": self.tts_syntheses_abandoned,
+        }
+
+
+class TurnTracker:
+    """
+    Tracks the one translation turn of a session that is in flight - sent to
+    the LLM or TTS but not yet audible - so that a barge-in can cancel it.
+
+    Shared by the translation processor (starts and cancels turns), the
+    aggregator (advances stages, drops output of cancelled turns) and the TTS
+    service (commits a turn once its audio has been synthesized).
+    """
+
+    def __init__(self, stats: BargeInStats):
+        self._ids = itertools.count(1)
+        self._stats = stats
+        self._cancelled: Set[int] = set()
+        self.turn_id: Optional[int] = None
+        self.source_text: Optional[str] = None
+        self.stage: Optional[str] = None
+
+    def start(self, source_text: str, stage: str = STAGE_LLM) -> int:
+        self.turn_id = next(self._ids)
+        self.source_text = source_text
+        self.stage = stage
+        return self.turn_id
+
+    def advance(self, turn_id: Optional[int], stage: str):
+        if turn_id is not None and turn_id == self.turn_id:
+            self.stage = stage
+
+    def commit(self):
+        """The in-flight turn can no longer be superseded"""
+        self.turn_id = None
+        self.source_text = None
+        self.stage = None
+
+    def audio_started(self):
+        """
+        TTS produced audio for the in-flight turn - it will be spoken, even if
+        it is queued behind the previous turn's audio, so it is final.
+        """
+        if self.stage == STAGE_TTS:
+            self.commit()
+
+    @property
+    def in_flight(self) -> bool:
+        return self.turn_id is not None
+
+    def cancel(self) -> Optional[str]:
+        """Cancel the in-flight turn and return its source text for re-translation"""
+        if self.turn_id is None:
+            return None
+
+        self._stats.turns_cancelled += 1
+        if self.stage == STAGE_LLM:
+            self._stats.llm_requests_cancelled += 1
+        else:
+            self._stats.tts_requests_skipped += 1
+
+        # Older ids can't reappear, so only the most recent few are worth keeping
+        self._cancelled = {i for i in self._cancelled if i > self.turn_id - 8}
+        self._cancelled.add(self.turn_id)
+
+        source_text = self.source_text
+        self.commit()
+        return source_text
+
+    def is_cancelled(self, turn_id: Optional[int]) -> bool:
+        return turn_id is not None and turn_id in self._cancelled
+
+    def dropped_llm_output(self, chars: int):
+        self._stats.llm_chars_dropped += chars
@@ -0,0 +1,90 @@
+import * as React from "react";
+
+const TRANSLATE_WS_URL = "ws://localhost:7860/ws/translate";
+const RECONNECT_DELAY_MS = 2000;
+
+export interface LiveTranslation {
+  id: number;
+  original: string;
+  translation: string;
+  isFinal: boolean;
+}
+
+// One WebSocket per page; the server debounces and cancels superseded requests
+export function useTranslationSocket() {
+  const socketRef = React.useRef<WebSocket | null>(null);
+  const requestIdRef = React.useRef(0);
+  const textsRef = React.useRef(new Map<number, string>());
+  const [isConnected, setIsConnected] = React.useState(false);
+  const [live, setLive] = React.useState<LiveTranslation | null>(null);
+
+  React.useEffect(() => {
+    let closed = false;
+    let reconnectTimer: ReturnType<typeof setTimeout> | undefined;
+
+    const connect = () => {
+      const socket = new WebSocket(TRANSLATE_WS_URL);
+      socketRef.current = socket;
+
+      socket.onopen = () => setIsConnected(true);
+      socket.onclose = () => {
+        setIsConnected(false);
+        if (!closed) {
+          reconnectTimer = setTimeout(connect, RECONNECT_DELAY_MS);
+        }
+      };
+      socket.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+        // Ignore anything that isn't for the latest request
+        if (data.id !== requestIdRef.current || data.type === "error") {
+          return;
+        }
+        setLive({
+          id: data.id,
+          original: textsRef.current.get(data.id) ?? data.original ?? "",
+          translation: data.translation,
+          isFinal: data.type === "final",
+        });
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(reconnectTimer);
+      socketRef.current?.close();
+    };
+  }, []);
+
+  const send = React.useCallback((text: string) => {
+    const socket = socketRef.current;
+    if (!socket || socket.readyState !== WebSocket.OPEN) {
+      return;
+    }
+    const id = requestIdRef.current + 1;
+    requestIdRef.current = id;
+    textsRef.current = new Map([[id, text]]);
+    if (!text.trim()) {
+      setLive(null);
+    }
+    socket.send(JSON.stringify({ id, text }));
+  }, []);
+
+  // Drop whatever is waiting or generating, e.g. before translating over HTTP
+  const cancel = React.useCallback(() => {
+    // Late partials for the cancelled request are ignored by id
+    requestIdRef.current += 1;
+    if (socketRef.current?.readyState === WebSocket.OPEN) {
+      socketRef.current.send(JSON.stringify({ type: "cancel" }));
+    }
+  }, []);
+
+  // The user kept this translation - the server stores it in translation memory
+  const commit = React.useCallback((id: number) => {
+    if (socketRef.current?.readyState === WebSocket.OPEN) {
+      socketRef.current.send(JSON.stringify({ type: "commit", id }));
+    }
+  }, []);
+
+  return { isConnected, live, send, cancel, commit };
+}
@@ -8,6 +8,7 @@ import { Textarea } from "@/components/ui/textarea";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent } from "@/components/ui/card";
 import { toast } from "sonner";
+import { useTranslationSocket } from "@/hooks/use-translation-socket";
 import pamirHero from "@/assets/pamir-hero.jpg";
 
 const Index = () => {
@@ -28,6 +29,7 @@ const Index = () => {
     timestamp: number;
     isActive: boolean;
   }>>([]);
+  const { live, send: sendLiveText, cancel: cancelLive, commit: commitLive } = useTranslationSocket();
 
   // Demo translation - will be replaced with real translation API
   const getLanguageLabel = (lang: SourceLanguage) => {
@@ -47,11 +49,53 @@ const Index = () => {
     setIsListening(!isListening);
   };
 
+  const handleInputChange = (text: string) => {
+    setInputText(text);
+    sendLiveText(text);
+  };
+
+  const commitTranslation = (translatedText: string) => {
+    const translation = {
+      sourceText: inputText,
+      translatedText,
+      sourceLanguage: getLanguageLabel(sourceLanguage)
+    };
+
+    setCurrentTranslation(translation);
+    setHasTranslated(true);
+
+    // Add to history
+    const newItem = {
+      id: Date.now().toString(),
+      ...translation,
+      timestamp: Date.now(),
+      isActive: true
+    };
+
+    setTranslationHistory(prev => [
+      ...prev.map(n => ({ ...n, isActive: false })),
+      newItem
+    ]);
+
+    setInputText("");
+    toast.success("Translation complete!");
+  };
+
   const handleTranslate = async () => {
     if (!inputText.trim()) {
       toast.error("Please enter text to translate");
       return;
     }
+
+    // Already translated while typing - no need for another request
+    if (live?.isFinal && live.original === inputText) {
+      commitLive(live.id);
+      commitTranslation(live.translation);
+      return;
+    }
+
+    // Translating over HTTP instead - don't have the LLM do it twice
+    cancelLive();
   
     toast.info("Translating...");
   
@@ -72,30 +116,7 @@ const Index = () => {
         return;
       }
   
-      const translation = {
-        sourceText: inputText,
-        translatedText: data.translation,
-        sourceLanguage: getLanguageLabel(sourceLanguage)
-      };
-  
-      setCurrentTranslation(translation);
-      setHasTranslated(true);
-      
-      // Add to history
-      const newItem = {
-        id: Date.now().toString(),
-        ...translation,
-        timestamp: Date.now(),
-        isActive: true
-      };
-      
-      setTranslationHistory(prev => [
-        ...prev.map(n => ({ ...n, isActive: false })),
-        newItem
-      ]);
-      
-      setInputText("");
-      toast.success("Translation complete!");
+      commitTranslation(data.translation);
       
     } catch (error) {
       toast.error("Failed to connect to translation service");
@@ -218,7 +239,7 @@ const Index = () => {
               {/* Microphone */}
               <div className="flex flex-col items-center gap-6">
                 <MicrophoneInput
-                  onTranscript={(text) => setInputText(text)}
+                  onTranscript={(text) => handleInputChange(text)}
                   isListening={isListening}
                   onToggle={handleToggleMic}
                 />
@@ -245,11 +266,16 @@ const Index = () => {
                 <div className="flex flex-col gap-3">
                   <Textarea
                     value={inputText}
-                    onChange={(e) => setInputText(e.target.value)}
+                    onChange={(e) => handleInputChange(e.target.value)}
                     onKeyPress={handleKeyPress}
                     placeholder="Type in any language... / Бо ягон забон нависед..."
                     className="bg-card/80 backdrop-blur-sm border-2 border-primary/20 focus:border-accent text-lg min-h-[120px] shadow-lg resize-none"
                   />
+                  {live && inputText.trim() && (
+                    <p className="text-sm text-muted-foreground italic px-1">
+                      🇹🇯 {live.translation}
+                    </p>
+                  )}
                   <Button
                     onClick={handleTranslate}
                     size="lg"
@@ -301,11 +327,16 @@ const Index = () => {
                 <div className="flex flex-col gap-3">
                   <Textarea
                     value={inputText}
-                    onChange={(e) => setInputText(e.target.value)}
+                    onChange={(e) => handleInputChange(e.target.value)}
                     onKeyPress={handleKeyPress}
                     placeholder="Translate another text... / Матни дигареро тарҷума кунед..."
                     className="text-lg min-h-[100px] resize-none"
                   />
+                  {live && inputText.trim() && (
+                    <p className="text-sm text-muted-foreground italic px-1">
+                      🇹🇯 {live.translation}
+                    </p>
+                  )}
                   <Button
                     onClick={handleTranslate}
                     size="lg"